@@ -6,28 +6,57 @@ Keeps the most recent version based on the status in YAML frontmatter.
 
 import os
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from collections import defaultdict
-from datetime import datetime
+from datetime import datetime, timedelta
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 def parse_task_file(file_path):
     """Parse task file and extract metadata"""
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
+            first_line = f.readline()
+            if not first_line.startswith('---'):
+                return None
+
+            # Only read up to the closing marker; the markdown body is never needed
+            lines = []
+            for line in f:
+                if line.rstrip() == '---':
+                    return yaml.load("".join(lines), Loader=Loader)
+                lines.append(line)
+
+            # No closing marker - fall back to parsing the whole file
+            f.seek(0)
             content = f.read()
-        
-        if content.startswith('---'):
-            parts = content.split('---', 2)
-            if len(parts) >= 2:
-                yaml_content = parts[1]
-                task_data = yaml.safe_load(yaml_content)
-                return task_data
+
+        parts = content.split('---', 2)
+        if len(parts) >= 2:
+            yaml_content = parts[1]
+            task_data = yaml.load(yaml_content, Loader=Loader)
+            return task_data
     except Exception as e:
         print(f"Error parsing {file_path}: {e}")
     return None
 
-def main():
-    base_dir = Path('/Users/adrian/repos/agent-task-management-system/tasks')
+def _parse_ts(value):
+    """Parse an updated_at value into a naive datetime for ordering"""
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.replace(tzinfo=None) - (value.utcoffset() or timedelta(0))
+        return value
+    if isinstance(value, str):
+        try:
+            return _parse_ts(datetime.fromisoformat(value))
+        except ValueError:
+            pass
+    return datetime.min
+
+def main(base_dir=Path('/Users/adrian/repos/agent-task-management-system/tasks')):
+    base_dir = Path(base_dir)
     
     # Status directory mapping
     status_dirs = {
@@ -42,82 +71,65 @@ def main():
     
     # Find all task files and group by task ID
     task_files = defaultdict(list)
+    file_paths = []
     
-    for status_dir in base_dir.iterdir():
-        if status_dir.is_dir() and not status_dir.name.startswith('.'):
-            for task_file in status_dir.glob('*.md'):
-                task_data = parse_task_file(task_file)
-                if task_data and 'id' in task_data:
-                    task_files[task_data['id']].append((task_file, task_data))
-    
+    # os.scandir exposes cached DirEntry type info, avoiding a stat per entry
+    with os.scandir(base_dir) as status_entries:
+        for status_entry in status_entries:
+            if not status_entry.is_dir(follow_symlinks=False) or status_entry.name.startswith('.'):
+                continue
+            with os.scandir(status_entry.path) as file_entries:
+                for file_entry in file_entries:
+                    if file_entry.is_file() and file_entry.name.endswith('.md'):
+                        file_paths.append(file_entry.path)
+
+    # Overlap file reads and YAML parsing across threads; results are
+    # grouped in the main thread so task_files needs no locking
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for file_path, task_data in zip(file_paths, executor.map(parse_task_file, file_paths)):
+            if task_data and 'id' in task_data:
+                update_time = _parse_ts(task_data.get('updated_at'))
+                task_files[task_data['id']].append((file_path, task_data, update_time))
+
     # Process duplicates
     duplicates_found = 0
     files_removed = 0
-    
+
     for task_id, file_list in task_files.items():
         if len(file_list) > 1:
             duplicates_found += 1
             print(f"\n🔍 Processing task: {task_id} ({len(file_list)} copies)")
-            
-            # Find the canonical version (most recent updated_at with correct status)
-            canonical_file = None
-            canonical_data = None
-            latest_update = None
-            
-            for file_path, task_data in file_list:
-                updated_at = task_data.get('updated_at')
-                status = task_data.get('status', 'unknown')
-                
-                print(f"  📄 {file_path.parent.name}/{file_path.name}: status={status}, updated={updated_at}")
-                
-                # Parse updated_at
-                if isinstance(updated_at, str):
-                    try:
-                        if updated_at.endswith('+00:00'):
-                            update_time = datetime.fromisoformat(updated_at.replace('+00:00', ''))
-                        else:
-                            update_time = datetime.fromisoformat(updated_at)
-                    except:
-                        update_time = datetime.min
-                elif isinstance(updated_at, datetime):
-                    update_time = updated_at
-                else:
-                    update_time = datetime.min
-                
-                # Check if this should be the canonical version
-                if latest_update is None or update_time > latest_update:
-                    # Verify the file is in the correct directory for its status
-                    expected_dir = status_dirs.get(status)
-                    if expected_dir and file_path.parent == expected_dir:
-                        canonical_file = file_path
-                        canonical_data = task_data
-                        latest_update = update_time
-                        print(f"    ✅ This is canonical (correct location + latest)")
-            
-            # If no canonical version found in correct location, use most recent
-            if canonical_file is None:
-                for file_path, task_data in file_list:
-                    updated_at = task_data.get('updated_at')
-                    if isinstance(updated_at, str):
-                        try:
-                            update_time = datetime.fromisoformat(updated_at.replace('+00:00', ''))
-                        except:
-                            update_time = datetime.min
-                    else:
-                        update_time = datetime.min
-                    
-                    if latest_update is None or update_time > latest_update:
-                        canonical_file = file_path
-                        canonical_data = task_data
-                        latest_update = update_time
-                
+
+            # Only duplicates need Path objects for parent/name checks
+            file_list = [(Path(file_path), task_data, update_time)
+                         for file_path, task_data, update_time in file_list]
+
+            for file_path, task_data, _ in file_list:
+                print(f"  📄 {file_path.parent.name}/{file_path.name}: "
+                      f"status={task_data.get('status', 'unknown')}, updated={task_data.get('updated_at')}")
+
+            # Find the canonical version in one pass: files in the directory matching
+            # their status always win (True > False), then the most recent updated_at
+            def in_correct_dir(entry):
+                return entry[0].parent == status_dirs.get(entry[1].get('status', 'unknown'))
+
+            canonical = max(file_list, key=lambda entry: (in_correct_dir(entry), entry[2]))
+            canonical_file = canonical[0]
+            if in_correct_dir(canonical):
+                print(f"    ✅ Canonical (correct location + latest): {canonical_file}")
+            else:
                 print(f"    ⚠️  Using most recent as canonical: {canonical_file}")
-            
+
             # Remove duplicate files
-            for file_path, task_data in file_list:
+            for file_path, _, _ in file_list:
                 if file_path != canonical_file:
                     print(f"    🗑️  Removing duplicate: {file_path}")
-                    file_path.unlink()
+                    try:
+                        os.unlink(os.fspath(file_path))
+                    except FileNotFoundError:
+                        # Already gone (e.g. removed concurrently) - nothing to clean up
+                        continue
                     files_removed += 1
     
     print(f"\n📊 Summary:")
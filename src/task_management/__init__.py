@@ -1,6 +1,25 @@
 from .task_manager import TaskManager
-from .task_validator import TaskValidator
-from .task_analytics import TaskAnalytics
-from .task_templates import TaskTemplates
 
-__all__ = ['TaskManager', 'TaskValidator', 'TaskAnalytics', 'TaskTemplates']
\ No newline at end of file
+__all__ = ['TaskManager', 'TaskValidator', 'TaskAnalytics', 'TaskTemplates']
+
+# Subsystems are resolved on first access (PEP 562) so importing the package,
+# e.g. for the CLI, only pays for the task manager
+_LAZY_EXPORTS = {
+    'TaskValidator': '.task_validator',
+    'TaskAnalytics': '.task_analytics',
+    'TaskTemplates': '.task_templates',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
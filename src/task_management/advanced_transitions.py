@@ -5,8 +5,12 @@ Provides intelligent dependency-based state changes, automated progression trigg
 and status validation with rollback capabilities for the task management system.
 """
 
+import heapq
+import itertools
 import logging
-from typing import Dict, List, Optional, Set, Any, Tuple
+import re
+from collections import Counter, defaultdict, deque
+from typing import Callable, Deque, Dict, FrozenSet, Iterable, List, Optional, Set, Any, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 from dataclasses import dataclass
@@ -15,6 +19,12 @@ from .task_manager import Task, TaskStatus, TaskPriority, TaskManager
 from utils.logger import logger
 
 
+MAX_TRANSITION_HISTORY = 10_000
+
+# Markers agents append to task notes to signal completion checks
+NOTES_MARKER_PATTERN = re.compile(r"validation_complete|tests_passed|docs_updated")
+
+
 class TransitionTrigger(Enum):
     """Types of transition triggers"""
     MANUAL = "manual"
@@ -56,9 +66,46 @@ class AdvancedTransitionEngine:
     
     def __init__(self, task_manager: TaskManager):
         self.task_manager = task_manager
-        self.transition_rules = self._initialize_transition_rules()
-        self.transition_history: List[TransitionEvent] = []
-        self.pending_transitions: Dict[str, List[Tuple[TransitionRule, datetime]]] = {}
+        # Every index maps id(rule) -> rule in insertion order, so removal is a keyed delete
+        # of that exact instance rather than an equality scan
+        self._rules: Dict[int, TransitionRule] = {}
+        # Rules bucketed by from_status so per-task lookup avoids a full scan
+        self._rules_by_from: Dict[TaskStatus, Dict[int, TransitionRule]] = defaultdict(dict)
+        # (from_status, to_status, trigger) -> rules, for O(1) removal lookup
+        self._rule_lookup: Dict[Tuple[TaskStatus, TaskStatus, TransitionTrigger], Dict[int, TransitionRule]] = defaultdict(dict)
+        for rule in self._initialize_transition_rules():
+            self._index_rule(rule)
+        self.transition_history: Deque[TransitionEvent] = deque(maxlen=MAX_TRANSITION_HISTORY)
+        # Running totals over the retained history so statistics don't rescan it
+        self._total_transitions = 0
+        self._automated_count = 0
+        self._trigger_counts: Counter = Counter()
+        self._recent_timestamps: Deque[datetime] = deque()
+        # Min-heap of (execute_time, seq, task_id, rule); seq breaks ties so rules are never compared
+        self._pending_heap: List[Tuple[datetime, int, str, TransitionRule]] = []
+        self._pending_seq = itertools.count()
+        # (task_id, id(rule)) pairs already queued, so re-evaluation doesn't enqueue duplicates
+        self._pending_keys: Set[Tuple[str, int]] = set()
+        # Per-agent task buckets, rebuilt lazily after transitions mutate state
+        self._agent_index: Optional[Dict[str, List[Task]]] = None
+        self._status_counts_by_agent: Dict[str, Counter] = {}
+        self._complete_ids: Optional[Set[str]] = None
+        # task_id -> (notes the markers were extracted from, markers found)
+        self._notes_markers: Dict[str, Tuple[Optional[str], FrozenSet[str]]] = {}
+        
+        # Condition name -> check, so _check_condition is a single lookup
+        self._condition_handlers: Dict[str, Callable[[Task], bool]] = {
+            "all_dependencies_complete": self._all_dependencies_complete,
+            "agent_available": lambda task: self._agent_available(task.agent),
+            "high_priority": lambda task: task.priority in (TaskPriority.HIGH, TaskPriority.CRITICAL),
+            "agent_has_capacity": lambda task: self._agent_has_capacity(task.agent),
+            "no_blocking_tasks": lambda task: self._no_blocking_tasks(task.agent),
+            "validation_passed": self._validation_passed,
+            "tests_green": self._tests_green,
+            "documentation_updated": self._documentation_updated,
+            "blocked_over_threshold": self._blocked_over_threshold,
+            "no_resolution_path": self._no_resolution_path,
+        }
         
     def _initialize_transition_rules(self) -> List[TransitionRule]:
         """Initialize default transition rules"""
@@ -130,9 +177,11 @@ class AdvancedTransitionEngine:
     def evaluate_transitions(self, task_id: Optional[str] = None) -> List[TransitionEvent]:
         """Evaluate and execute eligible transitions"""
         transitions_executed = []
+        self._invalidate_indexes()
         
-        tasks_to_check = [self.task_manager.get_task(task_id)] if task_id else list(self.task_manager.tasks_cache.values())
-        tasks_to_check = [t for t in tasks_to_check if t is not None]
+        # One snapshot list straight off the cache view; executed transitions save tasks mid-loop
+        candidates = (self.task_manager.get_task(task_id),) if task_id else self.task_manager.tasks_cache.values()
+        tasks_to_check = [t for t in candidates if t is not None]
         
         for task in tasks_to_check:
             eligible_rules = self._get_eligible_rules(task)
@@ -149,9 +198,48 @@ class AdvancedTransitionEngine:
         
         return transitions_executed
     
-    def _get_eligible_rules(self, task: Task) -> List[TransitionRule]:
+    def _invalidate_indexes(self) -> None:
+        """Drop cached task indexes so they are rebuilt on next use"""
+        self._agent_index = None
+        self._status_counts_by_agent = {}
+        self._complete_ids = None
+    
+    def _get_agent_index(self) -> Dict[str, List[Task]]:
+        """Bucket tasks by agent with a single pass over the task cache"""
+        if self._agent_index is None:
+            agent_index: Dict[str, List[Task]] = {}
+            status_counts: Dict[str, Counter] = {}
+            for task in self.task_manager.tasks_cache.values():
+                agent_index.setdefault(task.agent, []).append(task)
+                status_counts.setdefault(task.agent, Counter())[task.status] += 1
+            self._agent_index = agent_index
+            self._status_counts_by_agent = status_counts
+        return self._agent_index
+    
+    def _agent_status_counts(self, agent: str) -> Counter:
+        """Get task counts by status for an agent"""
+        self._get_agent_index()
+        return self._status_counts_by_agent.get(agent, Counter())
+    
+    def _get_complete_ids(self) -> Set[str]:
+        """Get the IDs of all completed tasks"""
+        if self._complete_ids is None:
+            complete = TaskStatus.COMPLETE
+            self._complete_ids = {
+                task_id for task_id, task in self.task_manager.tasks_cache.items()
+                if task.status is complete
+            }
+        return self._complete_ids
+    
+    @property
+    def transition_rules(self) -> List[TransitionRule]:
+        """Read-only snapshot of the active rules, in insertion order"""
+        return list(self._rules.values())
+    
+    def _get_eligible_rules(self, task: Task) -> Iterable[TransitionRule]:
         """Get transition rules eligible for the task's current status"""
-        return [rule for rule in self.transition_rules if rule.from_status == task.status]
+        bucket = self._rules_by_from.get(task.status)
+        return bucket.values() if bucket else ()
     
     def _evaluate_conditions(self, task: Task, rule: TransitionRule) -> bool:
         """Evaluate if all conditions for a transition rule are met"""
@@ -162,82 +250,60 @@ class AdvancedTransitionEngine:
     
     def _check_condition(self, task: Task, condition: str) -> bool:
         """Check a specific condition"""
-        if condition == "all_dependencies_complete":
-            return self._all_dependencies_complete(task)
-        
-        elif condition == "agent_available":
-            return self._agent_available(task.agent)
-        
-        elif condition == "high_priority":
-            return task.priority in [TaskPriority.HIGH, TaskPriority.CRITICAL]
-        
-        elif condition == "agent_has_capacity":
-            return self._agent_has_capacity(task.agent)
-        
-        elif condition == "no_blocking_tasks":
-            return self._no_blocking_tasks(task.agent)
-        
-        elif condition == "validation_passed":
-            return self._validation_passed(task)
-        
-        elif condition == "tests_green":
-            return self._tests_green(task)
-        
-        elif condition == "documentation_updated":
-            return self._documentation_updated(task)
-        
-        elif condition == "blocked_over_threshold":
-            return self._blocked_over_threshold(task)
-        
-        elif condition == "no_resolution_path":
-            return self._no_resolution_path(task)
-        
-        return False
+        handler = self._condition_handlers.get(condition)
+        return bool(handler and handler(task))
     
     def _all_dependencies_complete(self, task: Task) -> bool:
         """Check if all dependencies are complete"""
-        for dep_id in task.dependencies:
-            dep_task = self.task_manager.get_task(dep_id)
-            if not dep_task or dep_task.status != TaskStatus.COMPLETE:
-                return False
-        return True
+        complete_ids = self._get_complete_ids()
+        return all(dep_id in complete_ids for dep_id in task.dependencies)
     
     def _agent_available(self, agent: str) -> bool:
         """Check if agent is available (simplified heuristic)"""
-        agent_tasks = self.task_manager.get_tasks_by_agent(agent)
-        in_progress_count = len([t for t in agent_tasks if t.status == TaskStatus.IN_PROGRESS])
+        in_progress_count = self._agent_status_counts(agent)[TaskStatus.IN_PROGRESS]
         return in_progress_count < 3  # Max 3 concurrent tasks per agent
     
     def _agent_has_capacity(self, agent: str) -> bool:
         """Check if agent has capacity for new work"""
-        agent_tasks = self.task_manager.get_tasks_by_agent(agent)
-        active_count = len([t for t in agent_tasks if t.status in [TaskStatus.TODO, TaskStatus.IN_PROGRESS]])
+        counts = self._agent_status_counts(agent)
+        active_count = counts[TaskStatus.TODO] + counts[TaskStatus.IN_PROGRESS]
         return active_count < 5  # Max 5 active tasks per agent
     
     def _no_blocking_tasks(self, agent: str) -> bool:
         """Check if agent has no blocking higher priority tasks"""
-        agent_tasks = self.task_manager.get_tasks_by_agent(agent)
-        critical_todo = [t for t in agent_tasks if t.status == TaskStatus.TODO and t.priority == TaskPriority.CRITICAL]
-        return len(critical_todo) == 0
+        agent_tasks = self._get_agent_index().get(agent, [])
+        todo, critical = TaskStatus.TODO, TaskPriority.CRITICAL
+        return not any(t.status is todo and t.priority is critical for t in agent_tasks)
+    
+    def _get_notes_markers(self, task: Task) -> FrozenSet[str]:
+        """Get the completion markers present in a task's notes"""
+        cached = self._notes_markers.get(task.id)
+        # Notes are replaced (never mutated in place) on update, so identity means unchanged
+        if cached is not None and cached[0] is task.notes:
+            return cached[1]
+        
+        markers = frozenset(NOTES_MARKER_PATTERN.findall(task.notes or ""))
+        self._notes_markers[task.id] = (task.notes, markers)
+        return markers
     
     def _validation_passed(self, task: Task) -> bool:
         """Check if task validation has passed (placeholder)"""
         # Would integrate with actual validation system
-        return "validation_complete" in (task.notes or "")
+        return "validation_complete" in self._get_notes_markers(task)
     
     def _tests_green(self, task: Task) -> bool:
         """Check if tests are passing (placeholder)"""
         # Would integrate with CI/CD system
-        return "tests_passed" in (task.notes or "")
+        return "tests_passed" in self._get_notes_markers(task)
     
     def _documentation_updated(self, task: Task) -> bool:
         """Check if documentation is updated (placeholder)"""
         # Would check documentation system
-        return "docs_updated" in (task.notes or "")
+        return "docs_updated" in self._get_notes_markers(task)
     
     def _blocked_over_threshold(self, task: Task) -> bool:
         """Check if task has been blocked beyond threshold"""
-        if task.status != TaskStatus.BLOCKED:
+        if task.status is not TaskStatus.BLOCKED:
             return False
         
         # Check how long it's been blocked
@@ -247,13 +313,12 @@ class AdvancedTransitionEngine:
     def _no_resolution_path(self, task: Task) -> bool:
         """Check if there's no clear path to resolve blocking issues"""
         # Simplified heuristic - would be more sophisticated in practice
-        blocking_deps = []
-        for dep_id in task.dependencies:
-            dep_task = self.task_manager.get_task(dep_id)
-            if dep_task and dep_task.status == TaskStatus.BLOCKED:
-                blocking_deps.append(dep_task)
-        
-        return len(blocking_deps) > 0
+        cache = self.task_manager.tasks_cache
+        blocked = TaskStatus.BLOCKED
+        return any(
+            (dep_task := cache.get(dep_id)) is not None and dep_task.status is blocked
+            for dep_id in task.dependencies
+        )
     
     def _execute_transition(self, task: Task, rule: TransitionRule) -> Optional[TransitionEvent]:
         """Execute a transition"""
@@ -283,7 +348,8 @@ class AdvancedTransitionEngine:
                     rollback_id=rollback_id
                 )
                 
-                self.transition_history.append(event)
+                self._record_event(event)
+                self._invalidate_indexes()
                 logger.info(f"Auto-transitioned task {task.id}: {old_status.value} -> {rule.to_status.value}")
                 
                 # Trigger cascade evaluation for dependent tasks
@@ -296,16 +362,58 @@ class AdvancedTransitionEngine:
         
         return None
     
+    def _record_event(self, event: TransitionEvent) -> None:
+        """Append an event to the history and update running statistics"""
+        history = self.transition_history
+        if len(history) == history.maxlen:
+            # The deque drops its oldest event; take it out of the statistics too
+            self._forget_event(history[0])
+        history.append(event)
+        self._total_transitions += 1
+        if event.automated:
+            self._automated_count += 1
+        self._trigger_counts[event.trigger.value] += 1
+        self._recent_timestamps.append(event.timestamp)
+        if len(self._recent_timestamps) > len(history):
+            self._recent_timestamps.popleft()
+        self._prune_recent_timestamps()
+    
+    def _forget_event(self, event: TransitionEvent) -> None:
+        """Remove an event evicted from the history from the running statistics"""
+        self._total_transitions -= 1
+        if event.automated:
+            self._automated_count -= 1
+        trigger = event.trigger.value
+        self._trigger_counts[trigger] -= 1
+        if not self._trigger_counts[trigger]:
+            del self._trigger_counts[trigger]
+    
+    def _prune_recent_timestamps(self) -> None:
+        """Drop timestamps older than the 24-hour statistics window"""
+        recent_cutoff = datetime.now() - timedelta(hours=24)
+        while self._recent_timestamps and self._recent_timestamps[0] < recent_cutoff:
+            self._recent_timestamps.popleft()
+    
     def _queue_transition(self, task_id: str, rule: TransitionRule) -> None:
         """Queue a transition for later execution or approval"""
-        if task_id not in self.pending_transitions:
-            self.pending_transitions[task_id] = []
+        key = (task_id, id(rule))
+        if key in self._pending_keys:
+            return
+        self._pending_keys.add(key)
         
         execute_time = datetime.now() + timedelta(minutes=rule.delay_minutes)
-        self.pending_transitions[task_id].append((rule, execute_time))
+        heapq.heappush(self._pending_heap, (execute_time, next(self._pending_seq), task_id, rule))
         
         logger.info(f"Queued transition for task {task_id}: {rule.from_status.value} -> {rule.to_status.value}")
     
+    @property
+    def pending_transitions(self) -> Dict[str, List[Tuple[TransitionRule, datetime]]]:
+        """Read-only snapshot of queued transitions per task, in execution order"""
+        pending: Dict[str, List[Tuple[TransitionRule, datetime]]] = {}
+        for execute_time, _, task_id, rule in sorted(self._pending_heap, key=lambda entry: entry[:2]):
+            pending.setdefault(task_id, []).append((rule, execute_time))
+        return pending
+    
     def _create_rollback_point(self, task: Task) -> str:
         """Create a rollback point for the task"""
         rollback_id = f"rollback_{task.id}_{datetime.now().isoformat()}"
@@ -338,73 +446,70 @@ class AdvancedTransitionEngine:
     
     def _trigger_cascade_evaluation(self, completed_task_id: str) -> None:
         """Trigger evaluation for tasks that depend on the completed task"""
-        for task in self.task_manager.tasks_cache.values():
-            if completed_task_id in task.dependencies:
-                self.evaluate_transitions(task.id)
+        # get_dependent_ids returns a snapshot, so cascaded saves can't change it mid-loop
+        for task_id in self.task_manager.get_dependent_ids(completed_task_id):
+            self.evaluate_transitions(task_id)
     
     def process_pending_transitions(self) -> List[TransitionEvent]:
         """Process transitions that are queued for execution"""
         executed_transitions = []
         now = datetime.now()
+        self._invalidate_indexes()
         
-        for task_id, queued_transitions in list(self.pending_transitions.items()):
-            remaining_transitions = []
-            
-            for rule, execute_time in queued_transitions:
-                if now >= execute_time:
-                    task = self.task_manager.get_task(task_id)
-                    if task and self._evaluate_conditions(task, rule):
-                        event = self._execute_transition(task, rule)
-                        if event:
-                            executed_transitions.append(event)
-                else:
-                    remaining_transitions.append((rule, execute_time))
-            
-            if remaining_transitions:
-                self.pending_transitions[task_id] = remaining_transitions
-            else:
-                del self.pending_transitions[task_id]
+        # Only entries whose execute_time has passed are popped; the rest stay queued
+        while self._pending_heap and self._pending_heap[0][0] <= now:
+            _, _, task_id, rule = heapq.heappop(self._pending_heap)
+            self._pending_keys.discard((task_id, id(rule)))
+            task = self.task_manager.get_task(task_id)
+            if task and self._evaluate_conditions(task, rule):
+                event = self._execute_transition(task, rule)
+                if event:
+                    executed_transitions.append(event)
         
         return executed_transitions
     
     def get_transition_statistics(self) -> Dict[str, Any]:
         """Get statistics about transitions"""
-        if not self.transition_history:
+        if not self._total_transitions:
             return {"total_transitions": 0}
         
-        total = len(self.transition_history)
-        automated = len([e for e in self.transition_history if e.automated])
-        
-        # Count by trigger type
-        trigger_counts = {}
-        for event in self.transition_history:
-            trigger_counts[event.trigger.value] = trigger_counts.get(event.trigger.value, 0) + 1
+        total = self._total_transitions
+        automated = self._automated_count
         
         # Recent activity (last 24 hours)
-        recent_cutoff = datetime.now() - timedelta(hours=24)
-        recent_transitions = [e for e in self.transition_history if e.timestamp >= recent_cutoff]
+        self._prune_recent_timestamps()
         
         return {
             "total_transitions": total,
             "automated_transitions": automated,
             "automation_rate": automated / total if total > 0 else 0,
-            "trigger_distribution": trigger_counts,
-            "recent_transitions_24h": len(recent_transitions),
-            "pending_transitions": sum(len(queued) for queued in self.pending_transitions.values())
+            "trigger_distribution": dict(self._trigger_counts),
+            "recent_transitions_24h": len(self._recent_timestamps),
+            "pending_transitions": len(self._pending_heap)
         }
     
+    def _index_rule(self, rule: TransitionRule) -> None:
+        """Add a rule to the rule, from_status and full-key indexes"""
+        rule_id = id(rule)
+        self._rules[rule_id] = rule
+        self._rules_by_from[rule.from_status][rule_id] = rule
+        self._rule_lookup[(rule.from_status, rule.to_status, rule.trigger)][rule_id] = rule
+    
     def add_custom_rule(self, rule: TransitionRule) -> None:
         """Add a custom transition rule"""
-        self.transition_rules.append(rule)
+        self._index_rule(rule)
         logger.info(f"Added custom transition rule: {rule.from_status.value} -> {rule.to_status.value}")
     
     def remove_rule(self, from_status: TaskStatus, to_status: TaskStatus, trigger: TransitionTrigger) -> bool:
         """Remove a transition rule"""
-        for i, rule in enumerate(self.transition_rules):
-            if (rule.from_status == from_status and 
-                rule.to_status == to_status and 
-                rule.trigger == trigger):
-                del self.transition_rules[i]
-                logger.info(f"Removed transition rule: {from_status.value} -> {to_status.value}")
-                return True
-        return False
\ No newline at end of file
+        matching = self._rule_lookup.get((from_status, to_status, trigger))
+        if not matching:
+            return False
+        
+        # Oldest matching rule first, matching the order rules were added
+        rule_id = next(iter(matching))
+        rule = matching.pop(rule_id)
+        del self._rules_by_from[rule.from_status][rule_id]
+        del self._rules[rule_id]
+        logger.info(f"Removed transition rule: {from_status.value} -> {to_status.value}")
+        return True
@@ -2,41 +2,67 @@ import os
 import yaml
 from datetime import datetime
 from collections import defaultdict
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 
-from .task_manager import TaskManager, TaskStatus
+from .task_manager import Task, TaskManager, TaskStatus
+
+CATEGORY_ORDER = ("Features", "Improvements", "Bug Fixes", "Uncategorized")
+
+# Tag -> changelog category, in precedence order when a task has several
+TAG_TO_CATEGORY = {
+    "feature": "Features",
+    "bug-fix": "Bug Fixes",
+    "fixes": "Bug Fixes",
+    "improvement": "Improvements",
+}
 
 class ChangelogGenerator:
     def __init__(self, task_manager: TaskManager):
         self.task_manager = task_manager
+        # Completed tasks memoized against TaskManager.cache_version
+        self._last_version = -1
+        self._cached_completed: List[Task] = []
+
+    def _get_completed_tasks(self) -> List[Task]:
+        version = self.task_manager.cache_version
+        if version != self._last_version:
+            self._cached_completed = self.task_manager.get_tasks_by_status(TaskStatus.COMPLETE)
+            self._last_version = version
+        return self._cached_completed
 
     def generate_changelog(self) -> str:
-        changelog_entries = defaultdict(lambda: defaultdict(list))
+        # Flat (date, category) -> entries; pivoted per date only when rendering
+        changelog_entries: Dict[Tuple[str, str], List[str]] = defaultdict(list)
         
-        completed_tasks = self.task_manager.get_tasks_by_status(TaskStatus.COMPLETE)
+        completed_tasks = self._get_completed_tasks()
         
+        # Completed tasks cluster on a few days, so format each day only once
+        day_cache: Dict[int, str] = {}
+
         for task in completed_tasks:
             if task.updated_at:
-                date_str = task.updated_at.strftime("%Y-%m-%d")
+                ordinal = task.updated_at.toordinal()
+                date_str = day_cache.get(ordinal)
+                if date_str is None:
+                    date_str = day_cache[ordinal] = task.updated_at.strftime("%Y-%m-%d")
                 # Categorize by tags or a default category
-                category = "Uncategorized"
-                if "feature" in task.tags:
-                    category = "Features"
-                elif "bug-fix" in task.tags or "fixes" in task.tags:
-                    category = "Bug Fixes"
-                elif "improvement" in task.tags:
-                    category = "Improvements"
+                tags = set(task.tags or ())
+                category = next(
+                    (cat for tag, cat in TAG_TO_CATEGORY.items() if tag in tags),
+                    "Uncategorized"
+                )
                 
-                changelog_entries[date_str][category].append(f"- {task.title} ({task.id})")
-
-        changelog_content = "# Changelog\n\n"
-        for date_str in sorted(changelog_entries.keys(), reverse=True):
-            changelog_content += f"## {date_str}\n\n"
-            for category in ["Features", "Improvements", "Bug Fixes", "Uncategorized"]:
-                if changelog_entries[date_str][category]:
-                    changelog_content += f"### {category}\n\n"
-                    for entry in changelog_entries[date_str][category]:
-                        changelog_content += f"{entry}\n"
-                    changelog_content += "\n"
-        return changelog_content
+                changelog_entries[(date_str, category)].append(f"- {task.title} ({task.id})")
+
+        parts = ["# Changelog\n\n"]
+        for date_str in sorted({key[0] for key in changelog_entries}, reverse=True):
+            parts.append(f"## {date_str}\n\n")
+            for category in CATEGORY_ORDER:
+                entries = changelog_entries.get((date_str, category))
+                if entries:
+                    parts.append(f"### {category}\n\n")
+                    for entry in entries:
+                        parts.append(f"{entry}\n")
+                    parts.append("\n")
+        return "".join(parts)
 
@@ -7,65 +7,282 @@ task creation, status updates, analytics, and validation.
 """
 
 import argparse
+import io
+import os
 import sys
 import json
+import logging
 from datetime import datetime
+from functools import cached_property, lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 import click
-from rich.console import Console
-from rich.table import Table
 
-from .task_manager import TaskManager, TaskStatus, TaskPriority
-from .task_validator import TaskValidator
-from .task_analytics import TaskAnalytics
-from .task_templates import TaskTemplates
-from .changelog_generator import ChangelogGenerator
-from .task_deduplicator import TaskDeduplicator, MergeStrategy
-from utils.logger import logger, setup_logging
+from .task_manager import PRIORITY_BY_VALUE, STATUS_BY_VALUE, Task, TaskManager, TaskStatus, TaskPriority
+# utils.logger runs setup_logging() on import; configuring it again here would
+# rebuild every handler and reopen the log files for nothing
+from utils.logger import build_event_loggers, logger
 
-# Initialize enhanced logging for CLI
-setup_logging()
+
+class CLIError(Exception):
+    """Expected command failure (missing task, failed save, ...) reported without a traceback"""
+
+
+def _console():
+    """Create a rich Console; rich is only imported by commands that render with it"""
+    from rich.console import Console
+    return Console()
+
+
+# Fallback emoji and level for each CLI log event
+_LOG_EVENTS = {
+    'auto_fix_complete': ('✨', 'info'),
+    'auto_fix_start': ('🔧', 'info'),
+    'auto_transition': ('🔄', 'info'),
+    'command_complete': ('✅', 'info'),
+    'command_failed': ('❌', 'error'),
+    'command_start': ('▶️', 'info'),
+    'export_complete': ('📤', 'info'),
+    'note_added': ('📝', 'info'),
+    'query_result': ('🔍', 'info'),
+    'system_init': ('🚀', 'info'),
+    'task_created': ('✨', 'info'),
+    'task_updated': ('🔄', 'info'),
+    'user_help': ('❓', 'info'),
+    'validation_issues': ('⚠️', 'warning'),
+    'validation_passed': ('✅', 'info'),
+    'validation_rerun': ('🔍', 'info'),
+}
+
+# Event -> (log function, message prefix), resolved once at import
+_EVENT_LOGGERS = build_event_loggers(_LOG_EVENTS)
+
+# Whether command_failed records already reach the terminal through a console
+# handler, in which case main() doesn't echo the failure a second time
+_LOGGER_REACHES_TERMINAL = logger.isEnabledFor(logging.ERROR) and any(
+    isinstance(handler, logging.StreamHandler)
+    and handler.stream in (sys.stdout, sys.stderr)
+    and handler.level <= logging.ERROR
+    for handler in logger.handlers
+)
+
+
+def _log(event: str, message: str, *args, echo: Optional[str] = None) -> None:
+    """Log a CLI event through its semantic logger method or the plain fallback.
+    
+    Extra args are %-formatted into message by logging, only if the record is emitted.
+    With echo set, the same formatted message is also printed behind that prefix.
+    """
+    log_fn, prefix = _EVENT_LOGGERS[event]
+    log_fn(prefix + message if prefix else message, *args)
+    if echo is not None:
+        print(f"{echo}{message % args if args else message}")
+
+@lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO timestamp, reusing the result for strings seen before"""
+    return datetime.fromisoformat(value)
+
+def _split_csv(value: Optional[str]) -> List[str]:
+    """Split a comma-separated CLI value, stripping each item and dropping empty ones"""
+    if not value:
+        return []
+    return [item for item in map(str.strip, value.split(',')) if item]
+
+# json.dumps with non-default options builds a fresh encoder per call; build it once
+_encode_json = json.JSONEncoder(indent=2, default=str).encode
+
+def _enum_arg(by_value, values):
+    """Build an argparse type that accepts only the given values and returns enum members"""
+    members = {value: by_value[value] for value in values}
+    
+    def convert(value: str):
+        member = members.get(value)
+        if member is None:
+            raise argparse.ArgumentTypeError(
+                f"invalid choice: {value!r} (choose from {', '.join(map(repr, members))})")
+        return member
+    
+    convert.metavar = "{" + ",".join(members) + "}"
+    return convert
+
+
+# Accepted values, in help order, shared by the argparse and click front ends
+PRIORITY_CHOICES = ('low', 'medium', 'high', 'critical')
+STATUS_CHOICES = ('pending', 'blocked', 'todo', 'in_progress', 'complete', 'cancelled')
+
+# argparse converters so handlers receive enum members parsed once at startup
+PRIORITY_ARG = _enum_arg(PRIORITY_BY_VALUE, PRIORITY_CHOICES)
+STATUS_ARG = _enum_arg(STATUS_BY_VALUE, STATUS_CHOICES)
+
+# Commands that only read or write one task and can skip the full task scan
+LAZY_COMMANDS = {'show', 'add-note'}
+
+STATUS_ICONS = {
+    TaskStatus.PENDING: "⏳",
+    TaskStatus.BLOCKED: "🚫",
+    TaskStatus.BLOCKED_BY: "🔗",
+    TaskStatus.TODO: "📋",
+    TaskStatus.IN_PROGRESS: "🔄",
+    TaskStatus.COMPLETE: "✅",
+    TaskStatus.CANCELLED: "❌"
+}
+
+PRIORITY_ICONS = {
+    TaskPriority.CRITICAL: "🔴",
+    TaskPriority.HIGH: "🟡",
+    TaskPriority.MEDIUM: "🔵",
+    TaskPriority.LOW: "⚪"
+}
+
+PRIORITY_COLORS = {
+    TaskPriority.CRITICAL: "red",
+    TaskPriority.HIGH: "yellow",
+    TaskPriority.MEDIUM: "blue",
+    TaskPriority.LOW: "white"
+}
+
+# Fully rendered Status/Priority table cells; enum values are static, so no per-row formatting
+STATUS_CELLS = {status: f"{STATUS_ICONS[status]} {status.value}" for status in TaskStatus}
+PRIORITY_CELLS = {
+    priority: f"[{PRIORITY_COLORS[priority]}]{priority.value}[/{PRIORITY_COLORS[priority]}]"
+    for priority in TaskPriority
+}
+
+# Help for the action buttons, shown under rendered task lists
+ACTION_HELP = "\n".join([
+    "\n[bold]Interactive Features:[/bold]",
+    "🔗  Task IDs are clickable links that open files in your IDE",
+    "▶️  Start task (todo → in_progress)",
+    "✅  Complete task (→ complete)",
+    "🚫  Block task (→ blocked)",
+    "📋  Make ready/unblock (→ todo)",
+    "🔄  Reopen task (complete → in_progress)",
+    "👁️  View task details",
+    "💬  Add quick note",
+    "\n[dim]Copy commands from 'python -m src.task_management.cli [action] [task-id] [status]'[/dim]",
+])
+
+
+# Command name -> TaskCLI handler, filled in by @command on each method
+_COMMANDS: Dict[str, Callable[..., None]] = {}
+
+
+def command(name: str):
+    """Register a TaskCLI method as the handler for a CLI command"""
+    def decorator(fn):
+        _COMMANDS[name] = fn
+        return fn
+    return decorator
 
 
 class TaskCLI:
     """Command line interface for task management"""
     
-    def __init__(self, tasks_root: str = "tasks"):
-        self.task_manager = TaskManager(tasks_root)
-        self.validator = TaskValidator(task_manager=self.task_manager)
-        self.analytics = TaskAnalytics(self.task_manager.tasks_cache)
-        self.templates = TaskTemplates()
-        self.changelog_generator = ChangelogGenerator(self.task_manager)
-        self.deduplicator = TaskDeduplicator(self.task_manager)
+    def __init__(self, tasks_root: str = "tasks", lazy: bool = False):
+        self.tasks_root = tasks_root
+        self.lazy = lazy
+        # Derived results reused within an invocation, valid for one cache_version
+        self._derived_cache: Dict[str, Any] = {}
+        self._derived_version = -1
+    
+    def prepare(self, lazy: bool) -> None:
+        """Get a reused CLI ready for the next command.
+        
+        Task files changed since the last command are reloaded, and a lazily loaded
+        store is completed when the command needs every task.
+        """
+        if 'task_manager' not in self.__dict__:
+            # Not built yet; it will load the way this command needs
+            self.lazy = self.lazy and lazy
+        elif not lazy and self.task_manager.lazy:
+            self.task_manager.ensure_fully_loaded()
+        else:
+            self.task_manager.refresh_if_changed()
+    
+    # Subsystems are imported and built on first use, so a command only pays
+    # for the ones it actually touches
+    @cached_property
+    def task_manager(self) -> TaskManager:
+        """Task store, loaded on first use so commands like `templates` never scan tasks"""
+        return TaskManager(self.tasks_root, lazy=self.lazy)
+    
+    @cached_property
+    def validator(self):
+        """Task validator, created on first use"""
+        from .task_validator import TaskValidator
+        return TaskValidator(task_manager=self.task_manager)
+    
+    @cached_property
+    def analytics(self):
+        """Task analytics engine, created on first use"""
+        from .task_analytics import TaskAnalytics
+        return TaskAnalytics(self.task_manager.tasks_cache)
+    
+    @cached_property
+    def templates(self):
+        """Task template library, created on first use"""
+        from .task_templates import TaskTemplates
+        return TaskTemplates()
+    
+    @cached_property
+    def changelog_generator(self):
+        """Changelog generator, created on first use"""
+        from .changelog_generator import ChangelogGenerator
+        return ChangelogGenerator(self.task_manager)
+    
+    @cached_property
+    def deduplicator(self):
+        """Task deduplicator, created on first use"""
+        from .task_deduplicator import TaskDeduplicator
+        return TaskDeduplicator(self.task_manager)
+    
+    def _get_derived(self, key: str, compute):
+        """Return a cached derived value, recomputing after any task cache change"""
+        version = self.task_manager.cache_version
+        if version != self._derived_version:
+            self._derived_cache.clear()
+            self._derived_version = version
+        if key not in self._derived_cache:
+            self._derived_cache[key] = compute()
+        return self._derived_cache[key]
     
+    def _cached_overdue_ids(self) -> Set[str]:
+        """Get the IDs of overdue tasks, computed once per cache version"""
+        return self._get_derived(
+            'overdue_ids', lambda: {t.id for t in self.task_manager.get_overdue_tasks()})
+    
+    def _cached_statistics(self) -> Dict[str, Any]:
+        """Get task statistics, computed once per cache version"""
+        return self._get_derived('statistics', self.task_manager.get_task_statistics)
+    
+    def _cached_blocking_tasks(self) -> List[Task]:
+        """Get the tasks other tasks depend on, computed once per cache version"""
+        return self._get_derived('blocking_tasks', self.task_manager.get_blocking_tasks)
+    
+    @command('create')
     def create_task(self, args) -> None:
         """Create a new task"""
         if args.template:
             # Create from template
-            template_kwargs = {}
-            if args.template_vars:
-                for var in args.template_vars:
-                    if '=' in var:
-                        key, value = var.split('=', 1)
-                        template_kwargs[key] = value
-            
-            template_kwargs.update({
-                'task_id': args.id,
-                'title': args.title,
-                'agent': args.agent,
-                'priority': TaskPriority(args.priority) if args.priority else None
-            })
+            # One partition scan per key=value; entries without '=' are skipped
+            template_kwargs = {
+                key: value
+                for key, sep, value in (var.partition('=') for var in args.template_vars or ())
+                if sep
+            }
+            template_kwargs.update(
+                task_id=args.id,
+                title=args.title,
+                agent=args.agent,
+                priority=args.priority
+            )
             
             task = self.templates.create_task_from_template(args.template, **template_kwargs)
             if not task:
-                if hasattr(logger, 'template_error'):
-                    logger.template_error(f"Template '{args.template}' not found")
-                else:
-                    logger.error(f"❌ Template '{args.template}' not found")
-                print(f"❌ Template '{args.template}' not found")
-                return
+                raise CLIError(f"Template '{args.template}' not found")
         else:
             # Create manually
             task = self.task_manager.create_task(
@@ -73,82 +290,59 @@ class TaskCLI:
                 title=args.title,
                 description=args.description,
                 agent=args.agent,
-                priority=TaskPriority(args.priority),
+                priority=args.priority,
                 estimated_hours=args.estimated_hours,
-                due_date=datetime.fromisoformat(args.due_date) if args.due_date else None,
-                tags=args.tags.split(',') if args.tags else [],
-                dependencies=args.dependencies.split(',') if args.dependencies else []
+                due_date=_parse_iso(args.due_date) if args.due_date else None,
+                tags=_split_csv(args.tags),
+                dependencies=_split_csv(args.dependencies)
             )
         
         if task:
-            if hasattr(logger, 'task_created'):
-                logger.task_created(f"Created task {task.id}: {task.title}")
-            else:
-                logger.info(f"✨ Created task {task.id}: {task.title}")
+            _log('task_created', f"Created task {task.id}: {task.title}")
             print(f"✅ Created task: {task.id}")
             if args.validate:
                 self._validate_task(task.id)
         else:
-            if hasattr(logger, 'operation_failed'):
-                logger.operation_failed("Failed to create task")
-            else:
-                logger.error("❌ Failed to create task")
-            print("❌ Failed to create task")
+            raise CLIError("Failed to create task")
     
+    @command('status')
     def update_status(self, args) -> None:
         """Update task status"""
-        new_status = TaskStatus(args.status)
+        new_status = args.status
         success = self.task_manager.update_task_status(args.task_id, new_status, args.notes)
         
         if success:
-            if hasattr(logger, 'task_updated'):
-                logger.task_updated(f"Updated task {args.task_id} to {new_status.value}")
-            else:
-                logger.info(f"🔄 Updated task {args.task_id} to {new_status.value}")
-            print(f"✅ Updated task {args.task_id} to {new_status.value}")
+            _log('task_updated', f"Updated task {args.task_id} to {new_status.value}", echo='✅ ')
             
-            # Show any auto-transitioned tasks
-            auto_transitioned = self.task_manager.auto_transition_ready_tasks()
+            # Show any dependents this change unblocked
+            auto_transitioned = self.task_manager.auto_transition_dependents_of(args.task_id)
             if auto_transitioned:
-                if hasattr(logger, 'auto_transition'):
-                    logger.auto_transition(f"Auto-transitioned tasks: {', '.join(auto_transitioned)}")
-                else:
-                    logger.info(f"🔄 Auto-transitioned tasks: {', '.join(auto_transitioned)}")
-                print(f"🔄 Auto-transitioned tasks: {', '.join(auto_transitioned)}")
+                _log('auto_transition', f"Auto-transitioned tasks: {', '.join(auto_transitioned)}", echo='🔄 ')
         else:
-            if hasattr(logger, 'operation_failed'):
-                logger.operation_failed(f"Failed to update task {args.task_id}")
-            else:
-                logger.error(f"❌ Failed to update task {args.task_id}")
-            print(f"❌ Failed to update task {args.task_id}")
+            raise CLIError(f"Failed to update task {args.task_id}")
 
+    @command('add-note')
     def add_note(self, args) -> None:
         """Add a note to a task."""
         success = self.task_manager.add_note_to_task(args.task_id, args.note)
         if success:
-            if hasattr(logger, 'note_added'):
-                logger.note_added(f"Added note to task {args.task_id}: {args.note[:50]}...")
-            else:
-                logger.info(f"📝 Added note to task {args.task_id}")
+            _log('note_added', f"Added note to task {args.task_id}: {args.note[:50]}...")
             print(f"✅ Added note to task {args.task_id}")
         else:
-            if hasattr(logger, 'operation_failed'):
-                logger.operation_failed(f"Failed to add note to task {args.task_id}")
-            else:
-                logger.error(f"❌ Failed to add note to task {args.task_id}")
-            print(f"❌ Failed to add note to task {args.task_id}")
+            raise CLIError(f"Failed to add note to task {args.task_id}")
 
+    @command('update')
     def update_task(self, args) -> None:
         """Update task fields."""
         updates = {}
         if args.title: updates['title'] = args.title
         if args.description: updates['description'] = args.description
         if args.agent: updates['agent'] = args.agent
-        if args.priority: updates['priority'] = TaskPriority(args.priority)
+        if args.priority: updates['priority'] = args.priority
         if args.estimated_hours: updates['estimated_hours'] = args.estimated_hours
-        if args.due_date: updates['due_date'] = datetime.fromisoformat(args.due_date)
-        if args.tags: updates['tags'] = args.tags.split(',')
-        if args.dependencies: updates['dependencies'] = args.dependencies.split(',')
+        if args.due_date: updates['due_date'] = _parse_iso(args.due_date)
+        if args.tags: updates['tags'] = _split_csv(args.tags)
+        if args.dependencies: updates['dependencies'] = _split_csv(args.dependencies)
 
         success = self.task_manager.update_task_fields(args.task_id, **updates)
 
@@ -156,124 +350,129 @@ class TaskCLI:
             logger.info(f"Updated task {args.task_id}")
             print(f"✅ Updated task {args.task_id}")
         else:
-            logger.error(f"Failed to update task {args.task_id}")
-            print(f"❌ Failed to update task {args.task_id}")
+            raise CLIError(f"Failed to update task {args.task_id}")
+    
+    def _sorted_tasks(self, sort_by: str) -> Tuple[Task, ...]:
+        """Get all tasks sorted by a --sort-by key, computed once per cache version"""
+        def sort_tasks():
+            tasks = list(self.task_manager.tasks_cache.values())
+            if sort_by == 'priority':
+                # Every TaskPriority carries its rank, so a C-level attrgetter is the whole key
+                tasks.sort(key=attrgetter('priority.rank'))
+            elif sort_by in ('created', 'updated'):
+                # Untimestamped tasks keep their old place at the front (as datetime.min did),
+                # and the rest sort on a C-level attrgetter instead of a lambda
+                get_ts = attrgetter(f"{sort_by}_at")
+                undated = [t for t in tasks if get_ts(t) is None]
+                if undated:
+                    tasks = [t for t in tasks if get_ts(t) is not None]
+                tasks.sort(key=get_ts)
+                tasks = undated + tasks
+            return tuple(tasks)
+        return self._get_derived(f'sorted_by_{sort_by}', sort_tasks)
+    
+    def _sort_ranks(self, sort_by: str) -> Dict[str, int]:
+        """Get each task ID's position in the sorted view, computed once per cache version"""
+        return self._get_derived(
+            f'ranks_by_{sort_by}', lambda: {t.id: i for i, t in enumerate(self._sorted_tasks(sort_by))})
     
+    @command('list')
     def list_tasks(self, args) -> None:
         """List tasks with optional filters"""
-        tasks = list(self.task_manager.tasks_cache.values())
-        
-        # Filter out completed tasks by default unless status is specified or --include-completed is used
-        if not args.status and not getattr(args, 'include_completed', False):
-            tasks = [t for t in tasks if t.status != TaskStatus.COMPLETE]
-        
-        # Apply filters
-        if args.agent:
-            tasks = [t for t in tasks if t.agent == args.agent]
-        
-        if args.status:
-            status_filter = TaskStatus(args.status)
-            tasks = [t for t in tasks if t.status == status_filter]
-        
-        if args.priority:
-            priority_filter = TaskPriority(args.priority)
-            tasks = [t for t in tasks if t.priority == priority_filter]
-        
-        if args.tag:
-            tasks = [t for t in tasks if args.tag in t.tags]
-        
-        if args.overdue:
-            overdue_tasks = self.task_manager.get_overdue_tasks()
-            overdue_ids = {t.id for t in overdue_tasks}
-            tasks = [t for t in tasks if t.id in overdue_ids]
-        
-        # Sort tasks
-        if args.sort_by == 'priority':
-            priority_order = {TaskPriority.CRITICAL: 0, TaskPriority.HIGH: 1, 
-                            TaskPriority.MEDIUM: 2, TaskPriority.LOW: 3}
-            tasks.sort(key=lambda t: priority_order.get(t.priority, 4))
-        elif args.sort_by == 'created':
-            tasks.sort(key=lambda t: t.created_at or datetime.min)
-        elif args.sort_by == 'updated':
-            tasks.sort(key=lambda t: t.updated_at or datetime.min)
-        
-        # Display tasks
+        # --blockers replaces the listing entirely, so skip the sort and filters for it
         if args.blockers:
-            blocking_tasks = self.task_manager.get_blocking_tasks()
+            blocking_tasks = self._cached_blocking_tasks()
             if blocking_tasks:
-                print("🔗 Tasks Blocking Others:")
-                for task in blocking_tasks:
-                    print(f"  🔗 {task.id}: {task.title} ({task.agent})")
+                sys.stdout.write("🔗 Tasks Blocking Others:\n" + "".join(
+                    f"  🔗 {task.id}: {task.title} ({task.agent})\n" for task in blocking_tasks))
             else:
                 print("No tasks are currently blocking others.")
             return
-
+        
+        # Filter out completed tasks by default unless status is specified or --include-completed is used
+        hide_completed = not args.status and not getattr(args, 'include_completed', False)
+        status_filter = args.status
+        priority_filter = args.priority
+        agent_filter = args.agent
+        tag_filter = args.tag
+        overdue_ids = self._cached_overdue_ids() if args.overdue else None
+        complete = TaskStatus.COMPLETE
+        
+        if status_filter or agent_filter or priority_filter or tag_filter:
+            # Field filters come straight from the manager's indexes; the matches are put
+            # back in --sort-by order using each task's rank in the memoized sorted view
+            ids = self.task_manager.ids_where(status=status_filter, agent=agent_filter or None,
+                                              priority=priority_filter, tag=tag_filter or None)
+            ranks = self._sort_ranks(args.sort_by)
+            candidates = map(self.task_manager.tasks_cache.__getitem__, sorted(ids, key=ranks.__getitem__))
+        else:
+            candidates = self._sorted_tasks(args.sort_by)
+        
+        # Enum members are singletons, so identity checks skip Enum.__eq__
+        tasks = [
+            t for t in candidates
+            if (not hide_completed or t.status is not complete)
+            and (overdue_ids is None or t.id in overdue_ids)
+        ]
+        
         if not tasks:
-            if hasattr(logger, 'query_result'):
-                logger.query_result("No tasks found matching criteria")
-            else:
-                logger.info("🔍 No tasks found matching criteria")
-            print("No tasks found matching criteria")
+            _log('query_result', "No tasks found matching criteria", echo='')
             return
         
+        # Rendered views carry the action help in the same print as the tasks
         if args.format == 'table':
-            self._display_tasks_table(tasks)
+            self._display_tasks_table(tasks, footer=ACTION_HELP)
         elif args.format == 'json':
             self._display_tasks_json(tasks)
         else:
-            self._display_tasks_list(tasks)
-        
-        # Show action help if there are tasks with actions
-        if tasks and args.format != 'json':
-            self._show_action_help()
+            self._display_tasks_list(tasks, footer=ACTION_HELP)
     
+    @command('show')
     def show_task(self, args) -> None:
         """Show detailed information about a task"""
-        task = self.task_manager.get_task(args.task_id)
+        task = self.task_manager.get_task_lazy(args.task_id)
         if not task:
-            if hasattr(logger, 'task_not_found'):
-                logger.task_not_found(f"Task '{args.task_id}' not found")
-            else:
-                logger.warning(f"⚠️ Task '{args.task_id}' not found")
-            print(f"❌ Task '{args.task_id}' not found")
-            return
+            raise CLIError(f"Task '{args.task_id}' not found")
         
-        print(f"📋 Task: {task.title}")
-        print(f"ID: {task.id}")
-        print(f"Agent: {task.agent}")
-        print(f"Status: {task.status.value}")
-        print(f"Priority: {task.priority.value}")
+        out = io.StringIO()
+        out.write(f"📋 Task: {task.title}\n")
+        out.write(f"ID: {task.id}\n")
+        out.write(f"Agent: {task.agent}\n")
+        out.write(f"Status: {task.status.value}\n")
+        out.write(f"Priority: {task.priority.value}\n")
         
         if task.estimated_hours:
-            print(f"Estimated Hours: {task.estimated_hours}")
+            out.write(f"Estimated Hours: {task.estimated_hours}\n")
         
         if task.due_date:
-            print(f"Due Date: {task.due_date.strftime('%Y-%m-%d %H:%M')}")
+            out.write(f"Due Date: {task.due_date.strftime('%Y-%m-%d %H:%M')}\n")
         
         if task.tags:
-            print(f"Tags: {', '.join(task.tags)}")
+            out.write(f"Tags: {', '.join(task.tags)}\n")
         
         if task.dependencies:
-            print(f"Dependencies: {', '.join(task.dependencies)}")
+            out.write(f"Dependencies: {', '.join(task.dependencies)}\n")
         
-        print(f"\nDescription:\n{task.description}")
+        out.write(f"\nDescription:\n{task.description}\n")
         
         if task.notes:
-            print(f"\nNotes:\n{task.notes}")
+            out.write(f"\nNotes:\n{task.notes}\n")
         
         if task.created_at:
-            print(f"\nCreated: {task.created_at.strftime('%Y-%m-%d %H:%M')}")
+            out.write(f"\nCreated: {task.created_at.strftime('%Y-%m-%d %H:%M')}\n")
         else:
-            print("\nCreated: N/A")
+            out.write("\nCreated: N/A\n")
         if task.updated_at:
-            print(f"Updated: {task.updated_at.strftime('%Y-%m-%d %H:%M')}")
+            out.write(f"Updated: {task.updated_at.strftime('%Y-%m-%d %H:%M')}\n")
         else:
-            print("Updated: N/A")
+            out.write("Updated: N/A\n")
+        sys.stdout.write(out.getvalue())
         
         # Show validation if requested
         if args.validate:
             self._validate_task(args.task_id)
     
+    @command('validate')
     def validate_tasks(self, args) -> None:
         """Validate tasks"""
         self.task_manager.load_all_tasks() # Reload tasks to ensure up-to-date cache
@@ -286,25 +485,13 @@ class TaskCLI:
         """Validate a single task"""
         task = self.task_manager.get_task(task_id)
         if not task:
-            if hasattr(logger, 'task_not_found'):
-                logger.task_not_found(f"Task '{task_id}' not found")
-            else:
-                logger.warning(f"⚠️ Task '{task_id}' not found")
-            print(f"❌ Task '{task_id}' not found")
-            return
+            raise CLIError(f"Task '{task_id}' not found")
         
-        errors = self.validator.validate_task(task)
-        if not errors:
-            if hasattr(logger, 'validation_passed'):
-                logger.validation_passed(f"Task {task_id} validation passed")
-            else:
-                logger.info(f"✅ Task {task_id} validation passed")
-            print(f"✅ Task {task_id} validation passed")
+        warnings, errors = self.validator.validate_task(task)
+        if not warnings and not errors:
+            _log('validation_passed', f"Task {task_id} validation passed", echo='✅ ')
         else:
-            if hasattr(logger, 'validation_issues'):
-                logger.validation_issues(f"Task {task_id} has {len(errors)} validation issues")
-            else:
-                logger.warning(f"⚠️ Task {task_id} has {len(errors)} validation issues")
+            _log('validation_issues', f"Task {task_id} has {len(warnings) + len(errors)} validation issues")
             print(f"⚠️ Task {task_id} validation issues:")
             for warning in warnings:
                 icon = {'error': '❌', 'warning': '⚠️', 'info': 'ℹ️'}[warning.severity]
@@ -315,16 +502,19 @@ class TaskCLI:
     
     def _validate_all_tasks(self) -> None:
         """Validate all tasks in the system"""
-        warnings, errors = self.validator.validate_task_system(self.task_manager.tasks_cache)
+        from concurrent.futures import ProcessPoolExecutor
+        
+        # Per-task checks are CPU-bound and independent, so the validator spreads
+        # them over cores once the system is large enough to pay for the pool
+        warnings, errors = self.validator.validate_task_system(
+            self.task_manager.tasks_cache, executor_factory=ProcessPoolExecutor)
         report = self.validator.generate_validation_report(warnings, errors)
         print(report)
     
+    @command('auto-fix')
     def auto_fix_tasks(self, args) -> None:
         """Automatically fix common task issues"""
-        if hasattr(logger, 'auto_fix_start'):
-            logger.auto_fix_start("Starting auto-fix process for task issues")
-        else:
-            logger.info("🔧 Starting auto-fix process for task issues")
+        _log('auto_fix_start', "Starting auto-fix process for task issues")
         print("🔧 Auto-fixing task issues...")
         
         fixes_applied = 0
@@ -333,13 +523,15 @@ class TaskCLI:
         agent_fixes = self.validator.auto_fix_agent_issues(self.task_manager.tasks_cache)
         if agent_fixes:
             print(f"\n✅ Fixed {len(agent_fixes)} agent assignment issues:")
+            dirty = []
             for task_id, change in agent_fixes.items():
                 print(f"  • {task_id}: {change}")
-                # Save the updated task
                 task = self.task_manager.get_task(task_id)
                 if task:
-                    self.task_manager.save_task(task)
-                    fixes_applied += 1
+                    dirty.append(task)
+            # Save the updated tasks in one batch
+            self.task_manager.save_tasks(dirty)
+            fixes_applied += len(dirty)
         
         # Fix dependency status issues
         dependency_fixes = self._auto_fix_dependency_status()
@@ -350,50 +542,44 @@ class TaskCLI:
                 fixes_applied += len(dependency_fixes)
         
         if fixes_applied == 0:
-            if hasattr(logger, 'auto_fix_complete'):
-                logger.auto_fix_complete("No auto-fixable issues found")
-            else:
-                logger.info("✨ No auto-fixable issues found")
+            _log('auto_fix_complete', "No auto-fixable issues found")
             print("✨ No auto-fixable issues found!")
         else:
-            if hasattr(logger, 'auto_fix_complete'):
-                logger.auto_fix_complete(f"Applied {fixes_applied} fixes successfully")
-            else:
-                logger.info(f"🎉 Applied {fixes_applied} fixes successfully")
+            _log('auto_fix_complete', f"Applied {fixes_applied} fixes successfully")
             print(f"\n🎉 Applied {fixes_applied} fixes successfully!")
             
             # Run validation again to show remaining issues
             if not args.no_revalidate:
                 print("\n" + "="*50)
-                if hasattr(logger, 'validation_rerun'):
-                    logger.validation_rerun("Re-validating after auto-fixes")
-                else:
-                    logger.info("🔍 Re-validating after auto-fixes")
+                _log('validation_rerun', "Re-validating after auto-fixes")
                 print("🔍 Re-validating after fixes...")
                 self._validate_all_tasks()
     
     def _auto_fix_dependency_status(self) -> Dict[str, str]:
         """Fix tasks that have status TODO but unresolved dependencies"""
         fixes = {}
-        
-        for task in self.task_manager.tasks_cache.values():
-            if task.status == TaskStatus.TODO and task.dependencies:
-                # Check if dependencies are satisfied
-                deps_satisfied = all(
-                    (dep_task := self.task_manager.get_task(dep_id)) is not None and 
-                    dep_task.status == TaskStatus.COMPLETE
-                    for dep_id in task.dependencies
-                )
-                
-                if not deps_satisfied:
-                    old_status = task.status.value
-                    task.status = TaskStatus.BLOCKED
-                    self.task_manager.save_task(task)
-                    fixes[task.id] = f"{old_status} -> blocked"
-                    logger.info(f"Auto-fixed task {task.id} status: {old_status} -> blocked (dependencies not satisfied)")
+        todo = TaskStatus.TODO
+        # Completed IDs come straight from the status index; only TODO tasks change below
+        completed_ids = self.task_manager.by_status.get(TaskStatus.COMPLETE, set())
+        
+        # Pick every task to block in one scan, then save them as a batch, so the
+        # cache isn't rewritten while it's being iterated
+        to_block = [
+            task for task in self.task_manager.tasks_cache.values()
+            if task.status is todo and task.dependencies
+            and not completed_ids.issuperset(task.dependencies)
+        ]
+        
+        for task in to_block:
+            old_status = task.status.value
+            task.status = TaskStatus.BLOCKED
+            fixes[task.id] = f"{old_status} -> blocked"
+            logger.info(f"Auto-fixed task {task.id} status: {old_status} -> blocked (dependencies not satisfied)")
+        self.task_manager.save_tasks(to_block)
         
         return fixes
 
+    @command('update-blockers')
     def update_blockers(self, args) -> None:
         """Update the status of tasks that are blocking others."""
         updated_tasks = self.task_manager.update_blocking_task_statuses()
@@ -406,6 +592,7 @@ class TaskCLI:
             logger.info("No tasks found to update to BLOCKED_BY status.")
             print("No tasks found to update to BLOCKED_BY status.")
 
+    @command('generate-changelog')
     def generate_changelog(self, args) -> None:
         """Generate project changelog."""
         changelog_content = self.changelog_generator.generate_changelog()
@@ -414,6 +601,7 @@ class TaskCLI:
         logger.info(f"Changelog generated to {args.output}")
         print(f"✅ Changelog generated to {args.output}")
 
+    @command('promote-dependencies')
     def promote_dependencies(self, args) -> None:
         """Promote priority of tasks that are blocking others."""
         promoted_tasks = self.task_manager.promote_dependency_priority()
@@ -426,6 +614,7 @@ class TaskCLI:
             logger.info("No tasks found to promote.")
             print("No tasks found to promote.")
 
+    @command('assign-due-dates')
     def assign_due_dates(self, args) -> None:
         """Assigns due dates to critical priority tasks missing them."""
         updated_tasks = self.task_manager.assign_due_dates_to_critical_tasks()
@@ -438,6 +627,7 @@ class TaskCLI:
             logger.info("No critical tasks found missing due dates.")
             print("No critical tasks found missing due dates.")
     
+    @command('find-duplicates')
     def find_duplicates(self, args) -> None:
         """Find potential duplicate tasks"""
         duplicates = self.deduplicator.find_duplicates(include_completed=args.include_completed)
@@ -447,7 +637,7 @@ class TaskCLI:
             print("✅ No duplicate tasks found!")
             return
         
-        console = Console()
+        console = _console()
         
         # Show summary
         stats = self.deduplicator.get_duplicate_stats()
@@ -464,6 +654,7 @@ class TaskCLI:
         else:
             self._display_duplicates_list(duplicates)
     
+    @command('auto-merge')
     def auto_merge_duplicates(self, args) -> None:
         """Automatically merge duplicate tasks"""
         print("🔍 Scanning for auto-mergeable duplicates...")
@@ -481,12 +672,13 @@ class TaskCLI:
         else:
             print("ℹ️ No auto-mergeable duplicates found")
     
+    @command('merge-tasks')
     def merge_tasks_manual(self, args) -> None:
         """Manually merge two tasks"""
         try:
             preview = self.deduplicator.manual_merge_preview(args.task1, args.task2)
             
-            console = Console()
+            console = _console()
             print("🔍 Merge Preview:")
             print(f"Task 1: {preview['task1']['title']} ({args.task1})")
             print(f"Task 2: {preview['task2']['title']} ({args.task2})")
@@ -504,6 +696,7 @@ class TaskCLI:
                     return
             
             # Create merge strategy
+            from .task_deduplicator import MergeStrategy
             strategy = MergeStrategy(
                 keep_task_id=args.task1,  # Keep first task by default
                 remove_task_id=args.task2,
@@ -528,7 +721,7 @@ class TaskCLI:
     
     def _display_duplicates_list(self, duplicates) -> None:
         """Display duplicates in simple list format"""
-        console = Console()
+        console = _console()
         
         for i, dup in enumerate(duplicates, 1):
             confidence_color = {
@@ -550,7 +743,8 @@ class TaskCLI:
     
     def _display_duplicates_table(self, duplicates) -> None:
         """Display duplicates in table format"""
-        console = Console()
+        from rich.table import Table
+        console = _console()
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("Score", justify="center", width=6)
         table.add_column("Confidence", justify="center")
@@ -579,7 +773,7 @@ class TaskCLI:
     
     def _display_duplicates_detailed(self, duplicates) -> None:
         """Display duplicates with detailed information"""
-        console = Console()
+        console = _console()
         
         for i, dup in enumerate(duplicates, 1):
             console.print(f"\n[bold]Duplicate Pair {i}[/bold]")
@@ -600,222 +794,211 @@ class TaskCLI:
             
             console.print("-" * 80)
     
+    @command('analytics')
     def show_analytics(self, args) -> None:
         """Show task analytics"""
         self.analytics.update_tasks(self.task_manager.tasks_cache)
         
-        if args.type == 'overview':
-            self._show_overview_analytics()
-        elif args.type == 'agents':
-            self._show_agent_analytics()
-        elif args.type == 'velocity':
-            self._show_velocity_analytics()
-        elif args.type == 'bottlenecks':
-            self._show_bottleneck_analytics()
-        elif args.type == 'dependencies':
-            self._show_dependency_analytics()
-        else:
-            self._show_all_analytics()
+        sections = {
+            'overview': self._write_overview_analytics,
+            'agents': self._write_agent_analytics,
+            'velocity': self._write_velocity_analytics,
+            'bottlenecks': self._write_bottleneck_analytics,
+            'dependencies': self._write_dependency_analytics,
+        }
+        # Format the whole report into one buffer and write it once
+        out = io.StringIO()
+        sections.get(args.type, self._write_all_analytics)(out)
+        sys.stdout.write(out.getvalue())
     
-    def _show_overview_analytics(self) -> None:
+    def _write_overview_analytics(self, out: io.StringIO) -> None:
         """Show overview analytics"""
-        stats = self.task_manager.get_task_statistics()
+        stats = self._cached_statistics()
         completion_rate = self.analytics.get_completion_rate(30)
         
-        print("📊 Task System Overview")
-        print("=" * 40)
-        print(f"Total Tasks: {stats['total_tasks']}")
-        print(f"30-day Completion Rate: {completion_rate['completion_rate']:.1%}")
-        print(f"Overdue Tasks: {stats['overdue_count']}")
-        print(f"Dependency Violations: {stats['dependency_violations']}")
+        out.write("📊 Task System Overview\n")
+        out.write("=" * 40 + "\n")
+        out.write(f"Total Tasks: {stats['total_tasks']}\n")
+        out.write(f"30-day Completion Rate: {completion_rate['completion_rate']:.1%}\n")
+        out.write(f"Overdue Tasks: {stats['overdue_count']}\n")
+        out.write(f"Dependency Violations: {stats['dependency_violations']}\n")
         
         if stats['avg_completion_time']:
-            print(f"Average Completion Time: {stats['avg_completion_time']:.1f} hours")
+            out.write(f"Average Completion Time: {stats['avg_completion_time']:.1f} hours\n")
         
-        print(f"\nBy Status:")
+        out.write(f"\nBy Status:\n")
         for status, count in stats['by_status'].items():
-            print(f"  {status}: {count}")
+            out.write(f"  {status}: {count}\n")
         
-        print(f"\nBy Priority:")
+        out.write(f"\nBy Priority:\n")
         for priority, count in stats['by_priority'].items():
-            print(f"  {priority}: {count}")
+            out.write(f"  {priority}: {count}\n")
     
-    def _show_agent_analytics(self) -> None:
+    def _write_agent_analytics(self, out: io.StringIO) -> None:
         """Show agent performance analytics"""
         agent_perf = self.analytics.get_agent_performance()
         
-        print("👥 Agent Performance")
-        print("=" * 40)
+        out.write("👥 Agent Performance\n")
+        out.write("=" * 40 + "\n")
         
         for agent, perf in agent_perf.items():
-            print(f"\n🤖 {agent}")
-            print(f"  Total Tasks: {perf['total_tasks']}")
-            print(f"  Completion Rate: {perf['completion_rate']:.1%}")
-            print(f"  Active Tasks: {perf['in_progress_tasks']}")
-            print(f"  Overdue Tasks: {perf['overdue_tasks']}")
+            out.write(f"\n🤖 {agent}\n")
+            out.write(f"  Total Tasks: {perf['total_tasks']}\n")
+            out.write(f"  Completion Rate: {perf['completion_rate']:.1%}\n")
+            out.write(f"  Active Tasks: {perf['in_progress_tasks']}\n")
+            out.write(f"  Overdue Tasks: {perf['overdue_tasks']}\n")
             
             if perf['avg_completion_time'] > 0:
-                print(f"  Avg Completion: {perf['avg_completion_time']:.1f} hours")
+                out.write(f"  Avg Completion: {perf['avg_completion_time']:.1f} hours\n")
     
-    def _show_velocity_analytics(self) -> None:
+    def _write_velocity_analytics(self, out: io.StringIO) -> None:
         """Show velocity trend analytics"""
         velocity = self.analytics.get_velocity_trends(8)
         
-        print("🚀 Velocity Trends (8 weeks)")
-        print("=" * 40)
+        out.write("🚀 Velocity Trends (8 weeks)\n")
+        out.write("=" * 40 + "\n")
         
         if velocity.get('insufficient_data'):
-            print("Insufficient data for velocity analysis")
+            out.write("Insufficient data for velocity analysis\n")
             return
         
-        print(f"Current Trajectory: {velocity['current_trajectory']}")
-        print(f"Average Weekly Completion: {velocity['avg_weekly_completion']:.1f}")
-        print(f"Velocity Trend: {velocity['velocity_trend']:.1%}")
+        out.write(f"Current Trajectory: {velocity['current_trajectory']}\n")
+        out.write(f"Average Weekly Completion: {velocity['avg_weekly_completion']:.1f}\n")
+        out.write(f"Velocity Trend: {velocity['velocity_trend']:.1%}\n")
         
-        print(f"\nWeekly Data:")
+        out.write(f"\nWeekly Data:\n")
         for week in velocity['weekly_data'][-4:]:  # Last 4 weeks
-            week_start = datetime.fromisoformat(week['week_start']).strftime('%m/%d')
-            print(f"  {week_start}: {week['completed_tasks']} completed, {week['created_tasks']} created")
+            week_start = _parse_iso(week['week_start']).strftime('%m/%d')
+            out.write(f"  {week_start}: {week['completed_tasks']} completed, {week['created_tasks']} created\n")
     
-    def _show_bottleneck_analytics(self) -> None:
+    def _write_bottleneck_analytics(self, out: io.StringIO) -> None:
         """Show bottleneck analysis"""
         bottlenecks = self.analytics.get_bottleneck_analysis()
         
-        print("🚫 Bottleneck Analysis")
-        print("=" * 40)
+        out.write("🚫 Bottleneck Analysis\n")
+        out.write("=" * 40 + "\n")
         
         if bottlenecks['identified_bottlenecks']:
-            print("Identified Issues:")
+            out.write("Identified Issues:\n")
             for bottleneck in bottlenecks['identified_bottlenecks']:
                 severity_icon = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}[bottleneck['severity']]
-                print(f"  {severity_icon} {bottleneck['description']}")
+                out.write(f"  {severity_icon} {bottleneck['description']}\n")
         else:
-            print("✅ No significant bottlenecks detected")
+            out.write("✅ No significant bottlenecks detected\n")
         
-        print(f"\nBlocked Tasks: {bottlenecks['blocked_tasks_count']}")
-        print(f"Overdue Tasks: {bottlenecks['overdue_tasks']['count']}")
+        out.write(f"\nBlocked Tasks: {bottlenecks['blocked_tasks_count']}\n")
+        out.write(f"Overdue Tasks: {bottlenecks['overdue_tasks']['count']}\n")
         
         cycle_stats = bottlenecks['cycle_time_stats']
         if cycle_stats['tasks_analyzed'] > 0:
-            print(f"Avg Cycle Time: {cycle_stats['avg_hours']:.1f} hours")
-            print(f"Max Cycle Time: {cycle_stats['max_hours']:.1f} hours")
+            out.write(f"Avg Cycle Time: {cycle_stats['avg_hours']:.1f} hours\n")
+            out.write(f"Max Cycle Time: {cycle_stats['max_hours']:.1f} hours\n")
     
-    def _show_dependency_analytics(self) -> None:
+    def _write_dependency_analytics(self, out: io.StringIO) -> None:
         """Show dependency analysis"""
         deps = self.analytics.get_dependency_analysis()
         
-        print("🔗 Dependency Analysis")
-        print("=" * 40)
+        out.write("🔗 Dependency Analysis\n")
+        out.write("=" * 40 + "\n")
         
-        print(f"Total Dependencies: {deps['total_dependencies']}")
-        print(f"Avg Dependencies per Task: {deps['avg_dependencies_per_task']:.1f}")
-        print(f"Max Dependency Depth: {deps['dependency_depth']['max_depth']}")
-        print(f"Blocked by Dependencies: {deps['blocked_by_dependencies']}")
+        out.write(f"Total Dependencies: {deps['total_dependencies']}\n")
+        out.write(f"Avg Dependencies per Task: {deps['avg_dependencies_per_task']:.1f}\n")
+        out.write(f"Max Dependency Depth: {deps['dependency_depth']['max_depth']}\n")
+        out.write(f"Blocked by Dependencies: {deps['blocked_by_dependencies']}\n")
         
         if deps['critical_path_tasks']:
-            print(f"\nCritical Path Tasks:")
+            out.write(f"\nCritical Path Tasks:\n")
             for task_id in deps['critical_path_tasks'][:5]:
-                print(f"  • {task_id}")
+                out.write(f"  • {task_id}\n")
         
         if deps['dependency_risks']:
-            print(f"\nDependency Risks:")
+            out.write(f"\nDependency Risks:\n")
             for risk in deps['dependency_risks']:
-                print(f"  🔴 {risk['task_id']}: {risk['impact']}")
+                out.write(f"  🔴 {risk['task_id']}: {risk['impact']}\n")
     
-    def _show_all_analytics(self) -> None:
+    def _write_all_analytics(self, out: io.StringIO) -> None:
         """Show all analytics"""
-        self._show_overview_analytics()
-        print()
-        self._show_agent_analytics()
-        print()
-        self._show_velocity_analytics()
-        print()
-        self._show_bottleneck_analytics()
+        self._write_overview_analytics(out)
+        out.write("\n")
+        self._write_agent_analytics(out)
+        out.write("\n")
+        self._write_velocity_analytics(out)
+        out.write("\n")
+        self._write_bottleneck_analytics(out)
     
+    @command('templates')
     def list_templates(self, args) -> None:
         """List available task templates"""
         templates = self.templates.list_templates(
             agent=args.agent,
-            tags=args.tags.split(',') if args.tags else []
+            tags=_split_csv(args.tags)
         )
         
         if not templates:
-            if hasattr(logger, 'query_result'):
-                logger.query_result("No templates found matching criteria")
-            else:
-                logger.info("🔍 No templates found matching criteria")
-            print("No templates found matching criteria")
+            _log('query_result', "No templates found matching criteria", echo='')
             return
         
-        print("📝 Available Task Templates")
-        print("=" * 40)
+        # Format the whole report into one buffer and write it once
+        out = io.StringIO()
+        out.write("📝 Available Task Templates\n")
+        out.write("=" * 40 + "\n")
         
         for template in templates:
-            print(f"\n🔸 {template.id}")
-            print(f"  Name: {template.name}")
-            print(f"  Agent: {template.agent}")
-            print(f"  Priority: {template.priority.value}")
-            print(f"  Estimated Hours: {template.estimated_hours or 'N/A'}")
-            print(f"  Tags: {', '.join(template.tags)}")
+            out.write(f"\n🔸 {template.id}\n"
+                      f"  Name: {template.name}\n"
+                      f"  Agent: {template.agent}\n"
+                      f"  Priority: {template.priority.value}\n"
+                      f"  Estimated Hours: {template.estimated_hours or 'N/A'}\n"
+                      f"  Tags: {', '.join(template.tags)}\n")
+        sys.stdout.write(out.getvalue())
     
+    @command('export')
     def export_data(self, args) -> None:
         """Export task data or analytics"""
         if args.type == 'tasks':
-            # Export task data
-            tasks_data = {}
-            for task_id, task in self.task_manager.tasks_cache.items():
-                tasks_data[task_id] = task.to_dict()
-            
-            with open(args.output, 'w') as f:
-                json.dump(tasks_data, f, indent=2, default=str)
+            # Export task data, streaming one task at a time so only a single
+            # task's JSON is held in memory; output matches json.dump(indent=2)
+            exported = 0
+            encode = _encode_json
+            with open(args.output, 'w', buffering=1 << 20) as f:
+                f.write("{")
+                for task_id, task in self.task_manager.tasks_cache.items():
+                    task_json = encode(task.to_dict()).replace("\n", "\n  ")
+                    f.write(f"{',' if exported else ''}\n  {json.dumps(task_id)}: {task_json}")
+                    exported += 1
+                f.write("\n}" if exported else "}")
             
-            if hasattr(logger, 'export_complete'):
-                logger.export_complete(f"Exported {len(tasks_data)} tasks to {args.output}")
-            else:
-                logger.info(f"📤 Exported {len(tasks_data)} tasks to {args.output}")
-            print(f"✅ Exported {len(tasks_data)} tasks to {args.output}")
+            _log('export_complete', f"Exported {exported} tasks to {args.output}", echo='✅ ')
         
         elif args.type == 'analytics':
             # Export analytics
             success = self.analytics.export_analytics(args.output)
             if success:
-                if hasattr(logger, 'export_complete'):
-                    logger.export_complete(f"Exported analytics to {args.output}")
-                else:
-                    logger.info(f"📤 Exported analytics to {args.output}")
-                print(f"✅ Exported analytics to {args.output}")
+                _log('export_complete', f"Exported analytics to {args.output}", echo='✅ ')
             else:
-                if hasattr(logger, 'operation_failed'):
-                    logger.operation_failed("Failed to export analytics")
-                else:
-                    logger.error(f"❌ Failed to export analytics")
-                print(f"❌ Failed to export analytics")
+                raise CLIError("Failed to export analytics")
     
+    @command('auto-transition')
     def auto_transition(self, args) -> None:
         """Auto-transition ready tasks"""
         transitioned = self.task_manager.auto_transition_ready_tasks()
         
         if transitioned:
-            if hasattr(logger, 'auto_transition'):
-                logger.auto_transition(f"Auto-transitioned {len(transitioned)} tasks: {', '.join(transitioned)}")
-            else:
-                logger.info(f"🔄 Auto-transitioned {len(transitioned)} tasks")
+            _log('auto_transition', f"Auto-transitioned {len(transitioned)} tasks: {', '.join(transitioned)}")
             print(f"🔄 Auto-transitioned {len(transitioned)} tasks:")
             for task_id in transitioned:
                 print(f"  • {task_id}")
         else:
-            if hasattr(logger, 'query_result'):
-                logger.query_result("No tasks ready for auto-transition")
-            else:
-                logger.info("🔍 No tasks ready for auto-transition")
-            print("No tasks ready for auto-transition")
+            _log('query_result', "No tasks ready for auto-transition", echo='')
     
-    def _display_tasks_table(self, tasks) -> None:
+    def _display_tasks_table(self, tasks, footer: Optional[str] = None) -> None:
         """Display tasks in table format using rich with clickable action links."""
         if not tasks:
             return
 
-        console = Console()
+        from rich.console import Group
+        from rich.table import Table
+        console = _console()
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("ID", style="dim", width=12)
         table.add_column("Title", min_width=20)
@@ -824,69 +1007,57 @@ class TaskCLI:
         table.add_column("Priority", justify="right")
         table.add_column("Actions", justify="center", min_width=30)
 
+        # Bind per-row lookups once rather than resolving them for every task
+        add_row = table.add_row
+        compact_action_links = self._generate_compact_action_links
+        clickable_task_id = self._make_clickable_task_id
+        
         for task in tasks:
-            status_icon = {
-                TaskStatus.PENDING: "⏳",
-                TaskStatus.BLOCKED: "🚫", 
-                TaskStatus.BLOCKED_BY: "🔗",
-                TaskStatus.TODO: "📋",
-                TaskStatus.IN_PROGRESS: "🔄",
-                TaskStatus.COMPLETE: "✅",
-                TaskStatus.CANCELLED: "❌"
-            }.get(task.status, "❓")
-            
-            priority_color = {
-                TaskPriority.CRITICAL: "red",
-                TaskPriority.HIGH: "yellow", 
-                TaskPriority.MEDIUM: "blue",
-                TaskPriority.LOW: "white"
-            }.get(task.priority, "white")
-
             # Generate compact action links for table format
-            action_links = self._generate_compact_action_links(task)
+            action_links = compact_action_links(task)
 
             # Generate clickable task ID link
-            clickable_id = self._make_clickable_task_id(task)
+            clickable_id = clickable_task_id(task)
             
-            table.add_row(
+            add_row(
                 clickable_id,
                 task.title,
                 task.agent,
-                f"{status_icon} {task.status.value}",
-                f"[{priority_color}]{task.priority.value}[/{priority_color}]",
+                STATUS_CELLS[task.status],
+                PRIORITY_CELLS[task.priority],
                 action_links
             )
         
-        console.print(table)
+        console.print(Group(table, footer) if footer else table)
     
-    def _display_tasks_list(self, tasks) -> None:
+    def _display_tasks_list(self, tasks, footer: Optional[str] = None) -> None:
         """Display tasks in list format with clickable action links"""
-        console = Console()
+        console = _console()
+        out = io.StringIO()
+        # Bind per-row lookups once rather than resolving them for every task
+        write = out.write
+        status_icons = STATUS_ICONS.get
+        priority_icons = PRIORITY_ICONS.get
+        action_links_for = self._generate_action_links
+        clickable_task_id = self._make_clickable_task_id
+        
         for task in tasks:
-            status_icon = {
-                TaskStatus.PENDING: "⏳",
-                TaskStatus.BLOCKED: "🚫", 
-                TaskStatus.BLOCKED_BY: "🔗",
-                TaskStatus.TODO: "📋",
-                TaskStatus.IN_PROGRESS: "🔄",
-                TaskStatus.COMPLETE: "✅",
-                TaskStatus.CANCELLED: "❌"
-            }.get(task.status, "❓")
-            
-            priority_icon = {
-                TaskPriority.CRITICAL: "🔴",
-                TaskPriority.HIGH: "🟡", 
-                TaskPriority.MEDIUM: "🔵",
-                TaskPriority.LOW: "⚪"
-            }.get(task.priority, "❓")
+            status_icon = status_icons(task.status, "❓")
+            priority_icon = priority_icons(task.priority, "❓")
             
             # Generate clickable task ID link
-            clickable_id = self._make_clickable_task_id(task)
+            clickable_id = clickable_task_id(task)
             
             # Generate clickable action links based on current status
-            action_links = self._generate_action_links(task)
+            action_links = action_links_for(task)
             
-            console.print(f"{status_icon} {priority_icon} {clickable_id}: {task.title} ([bold]{task.agent}[/bold]) {action_links}")
+            write(f"{status_icon} {priority_icon} {clickable_id}: {task.title} ([bold]{task.agent}[/bold]) {action_links}\n")
+        
+        if footer:
+            write(footer + "\n")
+        
+        # One render/write for the whole list instead of one per task
+        console.print(out.getvalue(), end="")
     
     def _generate_action_links(self, task) -> str:
         """Generate action links for a task based on its status"""
@@ -952,230 +1123,262 @@ class TaskCLI:
             # Fallback to plain text if file not found
             return task.id
     
+    def _task_file_names(self) -> Dict[TaskStatus, Set[str]]:
+        """List each status directory once, so per-row link lookups need no stat calls"""
+        def list_dirs():
+            names = {}
+            for status, status_dir in self.task_manager.status_dirs.items():
+                try:
+                    with os.scandir(status_dir) as entries:
+                        names[status] = {entry.name for entry in entries}
+                except FileNotFoundError:
+                    names[status] = set()
+            return names
+        return self._get_derived('task_file_names', list_dirs)
+    
     def _get_task_file_path(self, task) -> str:
         """Get the full file path for a task"""
-        import os
+        file_names = self._task_file_names()
+        task_file_name = f"{task.id}.md"
         
         # Get the task file from the appropriate status directory
         status_dir = self.task_manager.status_dirs.get(task.status)
-        if status_dir:
-            task_file = status_dir / f"{task.id}.md"
-            if task_file.exists():
-                return os.path.abspath(task_file)
+        if status_dir and task_file_name in file_names.get(task.status, ()):
+            return os.path.abspath(status_dir / task_file_name)
         
         # If not found in expected location, search all directories
-        for status_dir in self.task_manager.status_dirs.values():
-            task_file = status_dir / f"{task.id}.md"
-            if task_file.exists():
-                return os.path.abspath(task_file)
+        for status, status_dir in self.task_manager.status_dirs.items():
+            if task_file_name in file_names[status]:
+                return os.path.abspath(status_dir / task_file_name)
         
         return None
     
-    def _show_action_help(self) -> None:
-        """Show help for action buttons in task list"""
-        console = Console()
-        console.print("\n[bold]Interactive Features:[/bold]")
-        console.print("🔗  Task IDs are clickable links that open files in your IDE")
-        console.print("▶️  Start task (todo → in_progress)")
-        console.print("✅  Complete task (→ complete)")
-        console.print("🚫  Block task (→ blocked)")
-        console.print("📋  Make ready/unblock (→ todo)")
-        console.print("🔄  Reopen task (complete → in_progress)")
-        console.print("👁️  View task details")
-        console.print("💬  Add quick note")
-        console.print("\n[dim]Copy commands from 'python -m src.task_management.cli [action] [task-id] [status]'[/dim]")
-    
     def _display_tasks_json(self, tasks) -> None:
         """Display tasks in JSON format"""
-        tasks_data = [task.to_dict() for task in tasks]
-        print(json.dumps(tasks_data, indent=2, default=str))
+        # Stream one task at a time; output matches json.dumps(list, indent=2)
+        encode = _encode_json
+        write = sys.stdout.write
+        separator = "[\n  "
+        for task in tasks:
+            write(separator + encode(task.to_dict()).replace("\n", "\n  "))
+            separator = ",\n  "
+        write("[]\n" if separator == "[\n  " else "\n]\n")
 
 
-def main():
-    """Main CLI entry point"""
-    parser = argparse.ArgumentParser(description="Agent Task Management CLI")
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
-    
-    # Create task command
-    create_parser = subparsers.add_parser('create', help='Create a new task')
-    create_parser.add_argument('--id', required=True, help='Task ID')
-    create_parser.add_argument('--title', required=True, help='Task title')
-    create_parser.add_argument('--description', help='Task description')
-    create_parser.add_argument('--agent', required=True, help='Assigned agent')
-    create_parser.add_argument('--priority', choices=['low', 'medium', 'high', 'critical'], default='medium')
-    create_parser.add_argument('--estimated-hours', type=float, help='Estimated hours')
-    create_parser.add_argument('--due-date', help='Due date (ISO format)')
-    create_parser.add_argument('--tags', help='Comma-separated tags')
-    create_parser.add_argument('--dependencies', help='Comma-separated dependency IDs')
-    create_parser.add_argument('--template', help='Template ID to use')
-    create_parser.add_argument('--template-vars', nargs='*', help='Template variables (key=value)')
-    create_parser.add_argument('--validate', action='store_true', help='Validate after creation')
-    
-    # Update status command
-    status_parser = subparsers.add_parser('status', help='Update task status')
-    status_parser.add_argument('task_id', help='Task ID')
-    status_parser.add_argument('status', choices=['pending', 'blocked', 'todo', 'in_progress', 'complete', 'cancelled'])
-    status_parser.add_argument('--notes', help='Status change notes')
-
-    # Add note command
-    add_note_parser = subparsers.add_parser('add-note', help='Add a note to a task')
-    add_note_parser.add_argument('task_id', help='Task ID')
-    add_note_parser.add_argument('note', help='The note to add')
-
-    # Update task command
-    update_parser = subparsers.add_parser('update', help='Update task fields')
-    update_parser.add_argument('task_id', help='Task ID')
-    update_parser.add_argument('--title', help='New title')
-    update_parser.add_argument('--description', help='New description')
-    update_parser.add_argument('--agent', help='New agent')
-    update_parser.add_argument('--priority', choices=['low', 'medium', 'high', 'critical'], help='New priority')
-    update_parser.add_argument('--estimated-hours', type=float, help='New estimated hours')
-    update_parser.add_argument('--due-date', help='New due date (ISO format)')
-    update_parser.add_argument('--tags', help='New comma-separated tags')
-    update_parser.add_argument('--dependencies', help='New comma-separated dependency IDs')
-
-    # List tasks command
-    list_parser = subparsers.add_parser('list', help='List tasks')
-    list_parser.add_argument('--agent', help='Filter by agent')
-    list_parser.add_argument('--status', choices=['pending', 'blocked', 'todo', 'in_progress', 'complete', 'cancelled'])
-    list_parser.add_argument('--priority', choices=['low', 'medium', 'high', 'critical'])
-    list_parser.add_argument('--tag', help='Filter by tag')
-    list_parser.add_argument('--overdue', action='store_true', help='Show only overdue tasks')
-    list_parser.add_argument('--include-completed', action='store_true', help='Include completed tasks in output')
-    list_parser.add_argument('--sort-by', choices=['priority', 'created', 'updated'], default='priority')
-    list_parser.add_argument('--format', choices=['list', 'table', 'json'], default='list')
-    list_parser.add_argument('--blockers', action='store_true', help='Show tasks that are blocking other tasks')
-    
-    # Show task command
-    show_parser = subparsers.add_parser('show', help='Show task details')
-    show_parser.add_argument('task_id', help='Task ID')
-    show_parser.add_argument('--validate', action='store_true', help='Include validation results')
-    
-    # Validate command
-    validate_parser = subparsers.add_parser('validate', help='Validate tasks')
-    validate_parser.add_argument('--task-id', help='Validate specific task')
-    
-    # Analytics command
-    analytics_parser = subparsers.add_parser('analytics', help='Show analytics')
-    analytics_parser.add_argument('--type', choices=['overview', 'agents', 'velocity', 'bottlenecks', 'dependencies'], default='overview')
-    
-    # Templates command
-    templates_parser = subparsers.add_parser('templates', help='List task templates')
-    templates_parser.add_argument('--agent', help='Filter by agent')
-    templates_parser.add_argument('--tags', help='Filter by tags (comma-separated)')
-    
-    # Export command
-    export_parser = subparsers.add_parser('export', help='Export data')
-    export_parser.add_argument('type', choices=['tasks', 'analytics'])
-    export_parser.add_argument('output', help='Output file path')
-    
-    # Auto-transition command
-    subparsers.add_parser('auto-transition', help='Auto-transition ready tasks')
+@lru_cache(maxsize=4)
+def _shared_cli(tasks_root: str) -> TaskCLI:
+    """One TaskCLI per tasks root; it starts lazy and loads fully once a command needs it"""
+    return TaskCLI(tasks_root, lazy=True)
+
+
+def _get_cli(tasks_root: str = "tasks", lazy: bool = False) -> TaskCLI:
+    """Get the shared TaskCLI for a tasks root, so repeated in-process invocations skip reloading.
     
-    # Auto-fix command
-    auto_fix_parser = subparsers.add_parser('auto-fix', help='Automatically fix common task issues')
-    auto_fix_parser.add_argument('--no-revalidate', action='store_true', 
-                                help='Skip re-validation after fixes')
+    Lazy and full commands share one task store, which is checked against the task
+    files before each reuse.
+    """
+    cli = _shared_cli(tasks_root)
+    cli.prepare(lazy)
+    return cli
 
-    # Update blockers command
-    update_blockers_parser = subparsers.add_parser('update-blockers', help='Update status of tasks that are blocking others')
 
-    # Generate changelog command
-    changelog_parser = subparsers.add_parser('generate-changelog', help='Generate project changelog')
-    changelog_parser.add_argument('--output', default='CHANGELOG.md', help='Output file path for changelog')
+# Argument definitions for each subcommand, applied only to the subparsers being built
 
-    # Promote dependencies command
-    promote_deps_parser = subparsers.add_parser('promote-dependencies', help='Promote priority of tasks that are blocking others')
+def _add_create_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--id', required=True, help='Task ID')
+    parser.add_argument('--title', required=True, help='Task title')
+    parser.add_argument('--description', help='Task description')
+    parser.add_argument('--agent', required=True, help='Assigned agent')
+    parser.add_argument('--priority', type=PRIORITY_ARG, metavar=PRIORITY_ARG.metavar, default=TaskPriority.MEDIUM)
+    parser.add_argument('--estimated-hours', type=float, help='Estimated hours')
+    parser.add_argument('--due-date', help='Due date (ISO format)')
+    parser.add_argument('--tags', help='Comma-separated tags')
+    parser.add_argument('--dependencies', help='Comma-separated dependency IDs')
+    parser.add_argument('--template', help='Template ID to use')
+    parser.add_argument('--template-vars', nargs='*', help='Template variables (key=value)')
+    parser.add_argument('--validate', action='store_true', help='Validate after creation')
 
-    # Assign due dates command
-    assign_due_dates_parser = subparsers.add_parser('assign-due-dates', help='Assigns due dates to critical tasks missing them')
-    
-    # Deduplication commands
-    find_dups_parser = subparsers.add_parser('find-duplicates', help='Find potential duplicate tasks')
-    find_dups_parser.add_argument('--include-completed', action='store_true', help='Include completed tasks in search')
-    find_dups_parser.add_argument('--format', choices=['list', 'table', 'detailed'], default='list', help='Output format')
+
+def _add_status_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('task_id', help='Task ID')
+    # No metavar here: on a positional it would replace 'status' in error messages
+    parser.add_argument('status', type=STATUS_ARG, help=f"New status: {', '.join(STATUS_CHOICES)}")
+    parser.add_argument('--notes', help='Status change notes')
+
+
+def _add_add_note_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('task_id', help='Task ID')
+    parser.add_argument('note', help='The note to add')
+
+
+def _add_update_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('task_id', help='Task ID')
+    parser.add_argument('--title', help='New title')
+    parser.add_argument('--description', help='New description')
+    parser.add_argument('--agent', help='New agent')
+    parser.add_argument('--priority', type=PRIORITY_ARG, metavar=PRIORITY_ARG.metavar, help='New priority')
+    parser.add_argument('--estimated-hours', type=float, help='New estimated hours')
+    parser.add_argument('--due-date', help='New due date (ISO format)')
+    parser.add_argument('--tags', help='New comma-separated tags')
+    parser.add_argument('--dependencies', help='New comma-separated dependency IDs')
+
+
+def _add_list_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--agent', help='Filter by agent')
+    parser.add_argument('--status', type=STATUS_ARG, metavar=STATUS_ARG.metavar)
+    parser.add_argument('--priority', type=PRIORITY_ARG, metavar=PRIORITY_ARG.metavar)
+    parser.add_argument('--tag', help='Filter by tag')
+    parser.add_argument('--overdue', action='store_true', help='Show only overdue tasks')
+    parser.add_argument('--include-completed', action='store_true', help='Include completed tasks in output')
+    parser.add_argument('--sort-by', choices=['priority', 'created', 'updated'], default='priority')
+    parser.add_argument('--format', choices=['list', 'table', 'json'], default='list')
+    parser.add_argument('--blockers', action='store_true', help='Show tasks that are blocking other tasks')
+
+
+def _add_show_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('task_id', help='Task ID')
+    parser.add_argument('--validate', action='store_true', help='Include validation results')
+
+
+def _add_validate_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--task-id', help='Validate specific task')
+
+
+def _add_analytics_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--type', choices=['overview', 'agents', 'velocity', 'bottlenecks', 'dependencies'], default='overview')
+
+
+def _add_templates_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--agent', help='Filter by agent')
+    parser.add_argument('--tags', help='Filter by tags (comma-separated)')
+
+
+def _add_export_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('type', choices=['tasks', 'analytics'])
+    parser.add_argument('output', help='Output file path')
+
+
+def _add_auto_fix_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--no-revalidate', action='store_true',
+                        help='Skip re-validation after fixes')
+
+
+def _add_generate_changelog_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--output', default='CHANGELOG.md', help='Output file path for changelog')
+
+
+def _add_find_duplicates_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--include-completed', action='store_true', help='Include completed tasks in search')
+    parser.add_argument('--format', choices=['list', 'table', 'detailed'], default='list', help='Output format')
+
+
+def _add_merge_tasks_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('task1', help='First task ID (will be kept)')
+    parser.add_argument('task2', help='Second task ID (will be merged into first)')
+    parser.add_argument('--auto-resolve', action='store_true', help='Auto-resolve conflicts without prompting')
+
+
+# Command name -> (help, argument builder), in the order shown by --help
+SUBCOMMANDS: Dict[str, Tuple[str, Optional[Callable[[argparse.ArgumentParser], None]]]] = {
+    'create': ('Create a new task', _add_create_args),
+    'status': ('Update task status', _add_status_args),
+    'add-note': ('Add a note to a task', _add_add_note_args),
+    'update': ('Update task fields', _add_update_args),
+    'list': ('List tasks', _add_list_args),
+    'show': ('Show task details', _add_show_args),
+    'validate': ('Validate tasks', _add_validate_args),
+    'analytics': ('Show analytics', _add_analytics_args),
+    'templates': ('List task templates', _add_templates_args),
+    'export': ('Export data', _add_export_args),
+    'auto-transition': ('Auto-transition ready tasks', None),
+    'auto-fix': ('Automatically fix common task issues', _add_auto_fix_args),
+    'update-blockers': ('Update status of tasks that are blocking others', None),
+    'generate-changelog': ('Generate project changelog', _add_generate_changelog_args),
+    'promote-dependencies': ('Promote priority of tasks that are blocking others', None),
+    'assign-due-dates': ('Assigns due dates to critical tasks missing them', None),
+    'find-duplicates': ('Find potential duplicate tasks', _add_find_duplicates_args),
+    'auto-merge': ('Automatically merge duplicate tasks', None),
+    'merge-tasks': ('Manually merge two tasks', _add_merge_tasks_args),
+}
+
+
+def _requested_command(argv) -> Optional[str]:
+    """Get the subcommand named on the command line, if any (the first non-option token)"""
+    for arg in argv:
+        if arg in ('-h', '--help'):
+            # Top-level help exits before the subcommand is parsed and must list them all
+            return None
+        if not arg.startswith('-'):
+            return arg
+    return None
+
+
+def build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """Build the CLI parser; for a known command only that subcommand's parser is built.
     
-    auto_merge_parser = subparsers.add_parser('auto-merge', help='Automatically merge duplicate tasks')
+    Help and unknown commands get every subparser as an argument-less shell, which is
+    all the command listing and the invalid-choice error need.
+    """
+    parser = argparse.ArgumentParser(description="Agent Task Management CLI")
+    parser.add_argument('-v', '--verbose', action='store_true', help='Log command start and completion')
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
-    merge_manual_parser = subparsers.add_parser('merge-tasks', help='Manually merge two tasks')
-    merge_manual_parser.add_argument('task1', help='First task ID (will be kept)')
-    merge_manual_parser.add_argument('task2', help='Second task ID (will be merged into first)')
-    merge_manual_parser.add_argument('--auto-resolve', action='store_true', help='Auto-resolve conflicts without prompting')
+    known = command in SUBCOMMANDS
+    # Each subcommand carries its handler, so dispatch is an attribute load on the
+    # parsed namespace; a subparser without a registered handler fails right here
+    for name in ((command,) if known else SUBCOMMANDS):
+        help_text, add_arguments = SUBCOMMANDS[name]
+        subparser = subparsers.add_parser(name, help=help_text)
+        if known and add_arguments is not None:
+            add_arguments(subparser)
+        subparser.set_defaults(func=_COMMANDS[name])
     
+    return parser
+
+
+def main() -> int:
+    """Main CLI entry point; returns the process exit code"""
+    parser = build_parser(_requested_command(sys.argv[1:]))
     args = parser.parse_args()
+    cmd = args.command
     
-    if not args.command:
-        if hasattr(logger, 'user_help'):
-            logger.user_help("CLI help requested")
-        else:
-            logger.info("❓ CLI help requested")
+    if not cmd:
+        _log('user_help', "CLI help requested")
         parser.print_help()
-        return
+        return 0
     
-    # Initialize CLI with logging
-    if hasattr(logger, 'system_init'):
-        logger.system_init("TaskCLI starting up")
-    else:
-        logger.info("🚀 TaskCLI starting up")
+    # Start/finish lines are noise for short commands run in loops; failures are always logged
+    verbose = args.verbose or logger.isEnabledFor(logging.DEBUG)
+    if verbose:
+        _log('system_init', "TaskCLI starting up")
     
-    cli = TaskCLI()
+    # Commands touching a single task don't need the whole task tree loaded;
+    # validation checks dependencies, so it still needs the full scan
+    lazy = cmd in LAZY_COMMANDS and not getattr(args, 'validate', False)
+    cli = _get_cli("tasks", lazy)
     
-    # Route commands with logging
-    if hasattr(logger, 'command_start'):
-        logger.command_start(f"Executing command: {args.command}")
-    else:
-        logger.info(f"▶️ Executing command: {args.command}")
+    if verbose:
+        _log('command_start', "Executing command: %s", cmd)
     
     try:
-        if args.command == 'create':
-            cli.create_task(args)
-        elif args.command == 'status':
-            cli.update_status(args)
-        elif args.command == 'add-note':
-            cli.add_note(args)
-        elif args.command == 'list':
-            cli.list_tasks(args)
-        elif args.command == 'show':
-            cli.show_task(args)
-        elif args.command == 'validate':
-            cli.validate_tasks(args)
-        elif args.command == 'analytics':
-            cli.show_analytics(args)
-        elif args.command == 'templates':
-            cli.list_templates(args)
-        elif args.command == 'export':
-            cli.export_data(args)
-        elif args.command == 'auto-transition':
-            cli.auto_transition(args)
-        elif args.command == 'auto-fix':
-            cli.auto_fix_tasks(args)
-        elif args.command == 'update-blockers':
-            cli.update_blockers(args)
-        elif args.command == 'generate-changelog':
-            cli.generate_changelog(args)
-        elif args.command == 'promote-dependencies':
-            cli.promote_dependencies(args)
-        elif args.command == 'assign-due-dates':
-            cli.assign_due_dates(args)
-        elif args.command == 'find-duplicates':
-            cli.find_duplicates(args)
-        elif args.command == 'auto-merge':
-            cli.auto_merge_duplicates(args)
-        elif args.command == 'merge-tasks':
-            cli.merge_tasks_manual(args)
-        
-        if hasattr(logger, 'command_complete'):
-            logger.command_complete(f"Command {args.command} completed successfully")
-        else:
-            logger.info(f"✅ Command {args.command} completed successfully")
+        args.func(cli, args)
+        
+        if verbose:
+            _log('command_complete', "Command %s completed successfully", cmd)
+        return 0
             
-    except Exception as e:
-        if hasattr(logger, 'command_failed'):
-            logger.command_failed(f"Command {args.command} failed: {str(e)}")
-        else:
-            logger.error(f"❌ Command {args.command} failed: {str(e)}")
-        print(f"❌ Command failed: {str(e)}")
-        sys.exit(1)
+    except CLIError as e:
+        # Expected failure already described by the handler
+        _log('command_failed', "Command %s failed: %s", cmd, e)
+        if not _LOGGER_REACHES_TERMINAL:
+            print(f"❌ {e}", file=sys.stderr)
+        return 1
+    except (OSError, ValueError) as e:
+        # Bad input or filesystem trouble; anything else is a bug and keeps its traceback
+        _log('command_failed', "Command %s failed: %s", cmd, e)
+        if not _LOGGER_REACHES_TERMINAL:
+            print(f"❌ Command failed: {e}", file=sys.stderr)
+        return 1
     finally:
         print("\n--- Reminder ---")
         print("Remember to update your tasks (status, notes, etc.) before committing changes.")
@@ -1192,7 +1395,7 @@ def cli():
 @click.option('--title', required=True, help='Task title')
 @click.option('--description', help='Task description')
 @click.option('--agent', required=True, help='Assigned agent')
-@click.option('--priority', type=click.Choice(['low', 'medium', 'high', 'critical']), default='medium')
+@click.option('--priority', type=click.Choice(PRIORITY_CHOICES), default='medium')
 @click.option('--estimated-hours', type=float, help='Estimated hours')
 @click.option('--due-date', help='Due date (ISO format)')
 @click.option('--tags', help='Comma-separated tags')
@@ -1210,7 +1413,7 @@ def create(task_id, title, description, agent, priority, estimated_hours, due_da
             self.title = title
             self.description = description
             self.agent = agent
-            self.priority = priority
+            self.priority = PRIORITY_BY_VALUE[priority]
             self.estimated_hours = estimated_hours
             self.due_date = due_date
             self.tags = tags
@@ -1219,8 +1422,11 @@ def create(task_id, title, description, agent, priority, estimated_hours, due_da
             self.template_vars = list(template_vars) if template_vars else None
             self.validate = validate
     
-    cli_instance = TaskCLI(tasks_root=tasks_root)
-    cli_instance.create_task(Args())
+    cli_instance = _get_cli(tasks_root)
+    try:
+        cli_instance.create_task(Args())
+    except CLIError as e:
+        raise click.ClickException(str(e))
 
 @cli.command(name='list')
 @click.option('--tasks-root', default='tasks', help='Tasks root directory')
@@ -1238,12 +1444,15 @@ def list_tasks_cmd(tasks_root):
             self.format = 'list'
             self.blockers = False
     
-    cli_instance = TaskCLI(tasks_root=tasks_root)
-    cli_instance.list_tasks(Args())
+    cli_instance = _get_cli(tasks_root)
+    try:
+        cli_instance.list_tasks(Args())
+    except CLIError as e:
+        raise click.ClickException(str(e))
 
 @cli.command()
 @click.argument('task_id')
-@click.argument('status', type=click.Choice(['pending', 'blocked', 'todo', 'in_progress', 'complete', 'cancelled']))
+@click.argument('status', type=click.Choice(STATUS_CHOICES))
 @click.option('--notes', help='Status change notes')
 @click.option('--tasks-root', default='tasks', help='Tasks root directory')
 def status(task_id, status, notes, tasks_root):
@@ -1251,16 +1460,19 @@ def status(task_id, status, notes, tasks_root):
     class Args:
         def __init__(self):
             self.task_id = task_id
-            self.status = status
+            self.status = STATUS_BY_VALUE[status]
             self.notes = notes
     
-    cli_instance = TaskCLI(tasks_root=tasks_root)
-    cli_instance.update_status(Args())
+    cli_instance = _get_cli(tasks_root)
+    try:
+        cli_instance.update_status(Args())
+    except CLIError as e:
+        raise click.ClickException(str(e))
 
 if __name__ == '__main__':
     import sys
     # Use the original argparse-based main for command line usage
     if len(sys.argv) > 1:
-        main()
+        raise SystemExit(main())
     else:
         cli()
\ No newline at end of file
@@ -6,7 +6,7 @@ including performance metrics, trend analysis, and predictive insights.
 """
 
 import json
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta, timezone
 from typing import Dict, List, Any, Optional, Tuple
 from collections import defaultdict, Counter
 import statistics
@@ -15,6 +15,13 @@ from .task_manager import Task, TaskStatus, TaskPriority
 from utils.logger import logger
 
 
+def _utc(value):
+    """Normalize a task timestamp to an aware UTC datetime; task files mix naive and aware values"""
+    if not isinstance(value, datetime):
+        return datetime.combine(value, time.min, tzinfo=timezone.utc)
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
 class TaskAnalytics:
     """Analytics engine for task management system"""
     
@@ -35,7 +42,6 @@ class TaskAnalytics:
         if cache_key in self.analytics_cache:
             return self.analytics_cache[cache_key]
         
-        from datetime import timezone
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
         
         total_tasks = 0
@@ -80,7 +86,7 @@ class TaskAnalytics:
             'recent_activity': 0
         })
         
-        now = datetime.now()
+        now = datetime.now(timezone.utc)
         recent_cutoff = now - timedelta(days=7)
         completion_times = defaultdict(list)
         
@@ -96,19 +102,19 @@ class TaskAnalytics:
                 
                 # Calculate completion time
                 if task.created_at and task.updated_at:
-                    completion_time = (task.updated_at - task.created_at).total_seconds() / 3600
+                    completion_time = (_utc(task.updated_at) - _utc(task.created_at)).total_seconds() / 3600
                     completion_times[agent].append(completion_time)
             
             elif task.status == TaskStatus.IN_PROGRESS:
                 stats['in_progress_tasks'] += 1
             
             # Check for overdue tasks
-            if (task.due_date and task.due_date < now and 
+            if (task.due_date and _utc(task.due_date) < now and 
                 task.status not in [TaskStatus.COMPLETE, TaskStatus.CANCELLED]):
                 stats['overdue_tasks'] += 1
             
             # Check recent activity
-            if task.updated_at and task.updated_at >= recent_cutoff:
+            if task.updated_at and _utc(task.updated_at) >= recent_cutoff:
                 stats['recent_activity'] += 1
         
         # Calculate derived metrics
@@ -129,7 +135,7 @@ class TaskAnalytics:
         if cache_key in self.analytics_cache:
             return self.analytics_cache[cache_key]
         
-        now = datetime.now()
+        now = datetime.now(timezone.utc)
         weekly_data = []
         
         for week in range(weeks):
@@ -148,14 +154,14 @@ class TaskAnalytics:
             for task in self.tasks.values():
                 # Tasks completed this week
                 if (task.status == TaskStatus.COMPLETE and task.updated_at and
-                    week_start <= task.updated_at < week_end):
+                    week_start <= _utc(task.updated_at) < week_end):
                     week_stats['completed_tasks'] += 1
                     if task.estimated_hours:
                         week_stats['total_story_points'] += task.estimated_hours
                     week_stats['agents_active'].add(task.agent)
                 
                 # Tasks created this week
-                if (task.created_at and week_start <= task.created_at < week_end):
+                if (task.created_at and week_start <= _utc(task.created_at) < week_end):
                     week_stats['created_tasks'] += 1
             
             week_stats['agents_active'] = len(week_stats['agents_active'])
@@ -205,10 +211,10 @@ class TaskAnalytics:
                 agent_active_tasks[task.agent] += 1
         
         # Identify overdue tasks
-        now = datetime.now()
+        now = datetime.now(timezone.utc)
         overdue_tasks = [
             task for task in self.tasks.values()
-            if task.due_date and task.due_date < now and 
+            if task.due_date and _utc(task.due_date) < now and 
             task.status not in [TaskStatus.COMPLETE, TaskStatus.CANCELLED]
         ]
         
@@ -216,7 +222,7 @@ class TaskAnalytics:
         cycle_times = []
         for task in self.tasks.values():
             if (task.status == TaskStatus.COMPLETE and task.created_at and task.updated_at):
-                cycle_time = (task.updated_at - task.created_at).total_seconds() / 3600
+                cycle_time = (_utc(task.updated_at) - _utc(task.created_at)).total_seconds() / 3600
                 cycle_times.append(cycle_time)
         
         analysis = {
@@ -285,7 +291,7 @@ class TaskAnalytics:
             'avg_age_days': 0
         })
         
-        now = datetime.now()
+        now = datetime.now(timezone.utc)
         
         for task in self.tasks.values():
             priority = task.priority.value
@@ -298,13 +304,13 @@ class TaskAnalytics:
             elif task.status == TaskStatus.IN_PROGRESS:
                 stats['in_progress'] += 1
             
-            if (task.due_date and task.due_date < now and 
+            if (task.due_date and _utc(task.due_date) < now and 
                 task.status not in [TaskStatus.COMPLETE, TaskStatus.CANCELLED]):
                 stats['overdue'] += 1
             
             # Calculate age
             if task.created_at:
-                age_days = (now - task.created_at).days
+                age_days = (now - _utc(task.created_at)).days
                 stats['avg_age_days'] = ((stats['avg_age_days'] * (stats['total'] - 1)) + age_days) / stats['total']
         
         # Calculate completion rates
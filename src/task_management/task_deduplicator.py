@@ -62,11 +62,11 @@ class TaskDeduplicator:
         """Find potential duplicate tasks"""
         logger.info("🔍 Scanning for duplicate tasks...")
         
-        tasks = list(self.task_manager.tasks_cache.values())
-        
-        # Filter out completed tasks unless requested
-        if not include_completed:
-            tasks = [t for t in tasks if t.status != TaskStatus.COMPLETE]
+        # Filter out completed tasks unless requested, straight off the cache view
+        tasks = [
+            t for t in self.task_manager.tasks_cache.values()
+            if include_completed or t.status != TaskStatus.COMPLETE
+        ]
         
         duplicates = []
         processed_pairs = set()
@@ -361,11 +361,7 @@ class TaskDeduplicator:
                     logger.info(f"🗑️ Removed duplicate task file: {remove_task_file}")
                 
                 # Remove from cache
-                if remove_task.id in self.task_manager.tasks_cache:
-                    del self.task_manager.tasks_cache[remove_task.id]
-                
-                if remove_task.id in self.task_manager.dependency_graph:
-                    del self.task_manager.dependency_graph[remove_task.id]
+                self.task_manager.evict_task(remove_task.id)
                 
                 # Update dependencies in other tasks that referenced the removed task
                 self._update_references(remove_task.id, keep_task.id)
@@ -8,15 +8,18 @@ and dependency tracking for the agentic framework.
 import os
 import yaml
 import json
+import hashlib
 import time
-from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Any, Tuple
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, FrozenSet, Iterable, List, Optional, Any, Set, Tuple
 from pathlib import Path
 import logging
 from dataclasses import dataclass, asdict, field
 from enum import Enum
+from operator import attrgetter
 
-from utils.logger import logger, audit_logger, performance_logger, log_performance
+from utils.logger import build_event_loggers, logger, audit_logger, performance_logger, log_performance
 
 
 class TaskStatus(Enum):
@@ -36,6 +39,33 @@ class TaskPriority(Enum):
     CRITICAL = "critical"
 
 
+# Sort rank on each member (most urgent first), so sorting needs no lookup table
+for _rank, _priority in enumerate((TaskPriority.CRITICAL, TaskPriority.HIGH,
+                                   TaskPriority.MEDIUM, TaskPriority.LOW)):
+    _priority.rank = _rank
+del _rank, _priority
+
+# Value -> member lookups; a dict hit skips Enum.__call__ for every parsed task
+STATUS_BY_VALUE = {status.value: status for status in TaskStatus}
+PRIORITY_BY_VALUE = {priority.value: priority for priority in TaskPriority}
+
+
+# Event -> (log function, message prefix), resolved once at import
+_EVENT_LOGGERS = build_event_loggers({
+    'system_init': ('🚀', 'info'),
+    'performance_log': ('⚡', 'info'),
+    'task_created': ('✨', 'info'),
+    'task_completed': ('✅', 'info'),
+    'task_updated': ('🔄', 'info'),
+})
+
+
+def _log_event(event: str, message: str) -> None:
+    """Log through the resolved semantic logger method for an event"""
+    log_fn, prefix = _EVENT_LOGGERS[event]
+    log_fn(prefix + message if prefix else message)
+
+
 @dataclass
 class Task:
     """Represents a task in the system"""
@@ -56,6 +86,10 @@ class Task:
     tags: List[str] = field(default_factory=list)
     status_timestamps: Dict[str, datetime] = field(default_factory=dict)
     
+    # Mutation counter (not a dataclass field); to_dict() reuses its last result until it moves
+    _version = 0
+    _dict_memo = None
+    
     def __post_init__(self):
         # Handle None values for list fields
         if self.dependencies is None:
@@ -70,8 +104,24 @@ class Task:
         if self.status.value not in self.status_timestamps:
             self.status_timestamps[self.status.value] = self.updated_at
     
+    def mark_changed(self) -> None:
+        """Invalidate the to_dict() memo; call after editing a task in place outside TaskManager"""
+        self._version += 1
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert task to dictionary for YAML serialization"""
+        memo = self._dict_memo
+        if memo is None or memo[0] != self._version:
+            memo = self._dict_memo = (self._version, self._build_dict())
+        # Copy the containers so callers can't corrupt the memo
+        data = dict(memo[1])
+        data['dependencies'] = list(data['dependencies'])
+        data['tags'] = list(data['tags'])
+        data['status_timestamps'] = dict(data['status_timestamps'])
+        return data
+    
+    def _build_dict(self) -> Dict[str, Any]:
+        """Serialize every field to plain YAML/JSON values"""
         data = asdict(self)
         # Convert enums to strings
         data['status'] = self.status.value
@@ -90,11 +140,17 @@ class Task:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Task':
         """Create task from dictionary"""
-        # Convert string enums back
+        # Work on copies so callers' dicts (e.g. cached raw file data) stay untouched
+        data = dict(data)
+        if isinstance(data.get('status_timestamps'), dict):
+            data['status_timestamps'] = dict(data['status_timestamps'])
+        
+        # Convert string enums back; anything not a known value (members, bad input)
+        # still goes through the enum constructor and its ValueError
         if 'status' in data:
-            data['status'] = TaskStatus(data['status'])
+            data['status'] = STATUS_BY_VALUE.get(data['status']) or TaskStatus(data['status'])
         if 'priority' in data:
-            data['priority'] = TaskPriority(data['priority'])
+            data['priority'] = PRIORITY_BY_VALUE.get(data['priority']) or TaskPriority(data['priority'])
         
         # Convert ISO strings back to datetimes
         for field in ['created_at', 'updated_at', 'due_date']:
@@ -133,13 +189,59 @@ class Task:
         return task
 
 
+# Opt-in parsed-task cache: set TASK_CACHE_DIR to a directory outside the task tree.
+# Entries are plain JSON task dicts keyed by file path and validated by (mtime_ns, size),
+# falling back to a content hash; bump TASK_CACHE_FORMAT whenever the entry layout changes
+TASK_CACHE_DIR_ENV = "TASK_CACHE_DIR"
+TASK_CACHE_FORMAT = 3
+
+
+def _encode_cache_value(value: Any) -> Any:
+    """json default hook for the task cache; tags YAML dates so they load back unchanged"""
+    if isinstance(value, datetime):
+        return {'__datetime__': value.isoformat()}
+    if isinstance(value, date):
+        return {'__date__': value.isoformat()}
+    raise TypeError(f"Cannot cache value of type {type(value).__name__}")
+
+
+def _decode_cache_value(obj: Dict[str, Any]) -> Any:
+    """json object hook reversing _encode_cache_value"""
+    if '__datetime__' in obj:
+        return datetime.fromisoformat(obj['__datetime__'])
+    if '__date__' in obj:
+        return date.fromisoformat(obj['__date__'])
+    return obj
+
+
 class TaskManager:
     """Main task management system"""
     
-    def __init__(self, tasks_root: str = "tasks"):
+    def __init__(self, tasks_root: str = "tasks", lazy: bool = False, cache_dir: Optional[str] = None):
         self.tasks_root = Path(tasks_root)
+        # Parsed-task cache file, or None when caching is off (the default)
+        cache_dir = cache_dir or os.environ.get(TASK_CACHE_DIR_ENV)
+        self.cache_file: Optional[Path] = None
+        if cache_dir:
+            root_key = hashlib.sha1(os.fsencode(self.tasks_root.resolve())).hexdigest()[:16]
+            self.cache_file = Path(cache_dir) / f"tasks-{root_key}.json"
+        # Lazy managers skip the full directory scan and load tasks on demand via get_task_lazy
+        self.lazy = lazy
         self.tasks_cache: Dict[str, Task] = {}
         self.dependency_graph: Dict[str, List[str]] = {}
+        # Reverse of dependency_graph: task ID -> IDs of tasks depending on it
+        self.dependents: Dict[str, Set[str]] = {}
+        # Secondary indexes: field value -> IDs of tasks with that value
+        self.by_status: Dict[TaskStatus, Set[str]] = {}
+        self.by_agent: Dict[str, Set[str]] = {}
+        self.by_priority: Dict[TaskPriority, Set[str]] = {}
+        self.by_tag: Dict[str, Set[str]] = {}
+        # Task ID -> (status, agent, priority, tags) as last indexed, for unindexing
+        self._indexed_fields: Dict[str, Tuple[TaskStatus, str, TaskPriority, Tuple[str, ...]]] = {}
+        # Bumped on every cache mutation so consumers can memoize derived data
+        self.cache_version = 0
+        # Task file path -> (mtime_ns, size) as last read or written by this manager
+        self._file_stats: Dict[str, Tuple[int, int]] = {}
         
         # Directory structure mapping with emoji and logical ordering
         self.status_dirs = {
@@ -157,10 +259,7 @@ class TaskManager:
             directory.mkdir(parents=True, exist_ok=True)
         
         # Log system initialization with emoji
-        if hasattr(logger, 'system_init'):
-            logger.system_init(f"TaskManager initialized with tasks_root: {tasks_root}")
-        else:
-            logger.info(f"🚀 TaskManager initialized with tasks_root: {tasks_root}")
+        _log_event('system_init', f"TaskManager initialized with tasks_root: {tasks_root}")
             
         if audit_logger:
             audit_logger.log_system_event(
@@ -169,37 +268,67 @@ class TaskManager:
                 {"tasks_root": str(tasks_root), "directories": list(str(d) for d in self.status_dirs.values())}
             )
         
-        self.load_all_tasks()
+        if not lazy:
+            self.load_all_tasks()
     
     def load_all_tasks(self) -> None:
         """Load all tasks from the filesystem"""
         start_time = time.time()
         
-        self.tasks_cache.clear()
-        self.dependency_graph.clear()
+        self._clear_cache()
         
         task_count = 0
         error_count = 0
         
+        # Reuse tasks parsed by an earlier run when their file content is unchanged
+        cached_files = self._read_task_cache()
+        loaded_files: Dict[str, Tuple[int, int, str, Dict[str, Any]]] = {}
+        changed = False
+        
         for status_dir in self.status_dirs.values():
             if status_dir.exists():
-                for task_file in status_dir.glob("*.md"):
-                    try:
-                        task = self.load_task_from_file(task_file)
-                        if task:
-                            self.tasks_cache[task.id] = task
-                            self.dependency_graph[task.id] = task.dependencies.copy()
-                            task_count += 1
-                    except Exception as e:
-                        error_count += 1
-                        logger.error(f"Error loading task from {task_file}: {e}")
+                with os.scandir(status_dir) as entries:
+                    for entry in entries:
+                        if entry.name.startswith('.') or not entry.name.endswith('.md'):
+                            continue
+                        task_file = Path(entry.path)
+                        try:
+                            stat = entry.stat()
+                            file_stat = (stat.st_mtime_ns, stat.st_size)
+                            self._file_stats[entry.path] = file_stat
+                            if self.cache_file is None:
+                                task = self.load_task_from_file(task_file)
+                            else:
+                                # Trust an unchanged stat; hash only files that were touched
+                                cached = cached_files.get(entry.path)
+                                if cached and tuple(cached[:2]) == file_stat:
+                                    digest, task_data = cached[2], cached[3]
+                                else:
+                                    with open(entry.path, 'rb') as f:
+                                        digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+                                    if cached and cached[2] == digest:
+                                        task_data = cached[3]
+                                    else:
+                                        task_data = self._read_task_data_logged(task_file)
+                                    changed = True
+                                task = None
+                                if task_data is not None:
+                                    loaded_files[entry.path] = (*file_stat, digest, task_data)
+                                    task = self._task_from_data(task_file, task_data)
+                            if task:
+                                self.tasks_cache[task.id] = task
+                                self._index_task(task)
+                                task_count += 1
+                        except Exception as e:
+                            error_count += 1
+                            logger.error(f"Error loading task from {task_file}: {e}")
+        
+        if self.cache_file is not None and (changed or loaded_files.keys() != cached_files.keys()):
+            self._write_task_cache(loaded_files)
         
         # Log performance metrics with emoji
         duration = time.time() - start_time
-        if hasattr(logger, 'performance_log'):
-            logger.performance_log(f"Loaded {task_count} tasks in {duration:.3f}s ({error_count} errors)")
-        else:
-            logger.info(f"⚡ Loaded {task_count} tasks in {duration:.3f}s ({error_count} errors)")
+        _log_event('performance_log', f"Loaded {task_count} tasks in {duration:.3f}s ({error_count} errors)")
         
         if performance_logger:
             performance_logger.log_operation_timing(
@@ -208,77 +337,171 @@ class TaskManager:
                 {"task_count": task_count, "error_count": error_count}
             )
     
+    def _clear_cache(self) -> None:
+        """Drop every cached task, index and recorded file stat"""
+        self.tasks_cache.clear()
+        self.dependency_graph.clear()
+        self.dependents.clear()
+        for index in (self.by_status, self.by_agent, self.by_priority, self.by_tag,
+                      self._indexed_fields, self._file_stats):
+            index.clear()
+        self.cache_version += 1
+    
+    def _scan_file_stats(self) -> Dict[str, Tuple[int, int]]:
+        """Stat every task file without parsing it: path -> (mtime_ns, size)"""
+        stats = {}
+        for status_dir in self.status_dirs.values():
+            if status_dir.exists():
+                with os.scandir(status_dir) as entries:
+                    for entry in entries:
+                        if entry.name.startswith('.') or not entry.name.endswith('.md'):
+                            continue
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        stats[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+    
+    def _record_file_stat(self, path: Path) -> None:
+        """Remember a task file's stat after this manager read or wrote it"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self._file_stats.pop(str(path), None)
+        else:
+            self._file_stats[str(path)] = (stat.st_mtime_ns, stat.st_size)
+    
+    def refresh_if_changed(self) -> bool:
+        """Reload cached tasks whose files changed outside this manager; returns whether it did.
+        
+        A fully loaded manager compares every task file; a lazy one only the files it has loaded.
+        """
+        if self.lazy:
+            for path, recorded in self._file_stats.items():
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    break
+                if (stat.st_mtime_ns, stat.st_size) != recorded:
+                    break
+            else:
+                return False
+            # Lazily loaded tasks are cheap to fetch again, so start over
+            self._clear_cache()
+            return True
+        
+        if self._scan_file_stats() == self._file_stats:
+            return False
+        self.load_all_tasks()
+        return True
+    
+    def ensure_fully_loaded(self) -> None:
+        """Turn a lazy manager into a fully loaded one"""
+        if self.lazy:
+            self.lazy = False
+            self.load_all_tasks()
+    
+    def _read_task_cache(self) -> Dict[str, Tuple[int, int, str, Dict[str, Any]]]:
+        """Read the parsed-task cache: file path -> (mtime_ns, size, content hash, task dict)"""
+        if self.cache_file is None:
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f, object_hook=_decode_cache_value)
+            if data.get('format') == TASK_CACHE_FORMAT:
+                return data['files']
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            # A stale or corrupt cache only costs a full parse
+            logger.debug(f"Ignoring unreadable task cache: {e}")
+        return {}
+    
+    def _write_task_cache(self, files: Dict[str, Tuple[int, int, str, Dict[str, Any]]]) -> None:
+        """Atomically replace the parsed-task cache"""
+        tmp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'format': TASK_CACHE_FORMAT, 'files': files}, f, default=_encode_cache_value)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            logger.debug(f"Could not write task cache: {e}")
+            try:
+                os.unlink(tmp_file)
+            except OSError:
+                pass
+    
     def load_task_from_file(self, file_path: Path) -> Optional[Task]:
         """Load a single task from a markdown file"""
+        task_data = self._read_task_data_logged(file_path)
+        if task_data is None:
+            return None
+        return self._task_from_data(file_path, task_data)
+    
+    def _task_from_data(self, file_path: Path, task_data: Dict[str, Any]) -> Optional[Task]:
+        """Build a Task from a file's raw fields, logging instead of raising on bad data"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Parse YAML frontmatter
-            if content.startswith('---'):
-                parts = content.split('---', 2)
-                if len(parts) >= 2:
-                    yaml_content = parts[1]
-                    task_data = yaml.safe_load(yaml_content)
-                    
-                    # Handle missing required fields
-                    if 'id' not in task_data:
-                        task_data['id'] = file_path.stem
-                    if 'status' not in task_data:
-                        # Infer status from directory
-                        for status, directory in self.status_dirs.items():
-                            if file_path.parent == directory:
-                                task_data['status'] = status.value
-                                break
-                    
-                    task = Task.from_dict(task_data)
-                    return task
-            else:
-                # Handle old format files
-                lines = content.strip().split('\n')
-                task_data = {}
-                for line in lines:
-                    if ':' in line:
-                        key, value = line.split(':', 1)
-                        task_data[key.strip()] = value.strip()
-                
-                if 'id' in task_data:
-                    return Task.from_dict(task_data)
-                    
+            return Task.from_dict(task_data)
         except Exception as e:
             logger.error(f"Error parsing task file {file_path}: {e}")
+        return None
+    
+    def _read_task_data_logged(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """Read a task file's raw fields, logging instead of raising on bad files"""
+        try:
+            return self._read_task_data(file_path)
+        except Exception as e:
+            logger.error(f"Error parsing task file {file_path}: {e}")
+        return None
+    
+    def _read_task_data(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """Read a task file's raw fields from its YAML frontmatter (or old key: value format)"""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        # Parse YAML frontmatter
+        if content.startswith('---'):
+            parts = content.split('---', 2)
+            if len(parts) >= 2:
+                yaml_content = parts[1]
+                task_data = yaml.safe_load(yaml_content)
+                
+                # Handle missing required fields
+                if 'id' not in task_data:
+                    task_data['id'] = file_path.stem
+                if 'status' not in task_data:
+                    # Infer status from directory
+                    for status, directory in self.status_dirs.items():
+                        if file_path.parent == directory:
+                            task_data['status'] = status.value
+                            break
+                
+                return task_data
+        else:
+            # Handle old format files
+            lines = content.strip().split('\n')
+            task_data = {}
+            for line in lines:
+                if ':' in line:
+                    key, value = line.split(':', 1)
+                    task_data[key.strip()] = value.strip()
+            
+            if 'id' in task_data:
+                return task_data
         
         return None
     
     def save_task(self, task: Task) -> bool:
         """Save a task to the appropriate directory"""
         try:
-            if task.created_at is None:
-                task.created_at = datetime.now()
-            task.updated_at = datetime.now()
-            
-            # Determine target directory
-            target_dir = self.status_dirs[task.status]
-            target_file = target_dir / f"{task.id}.md"
-            
-            # Remove from old location if status changed
-            old_task = self.tasks_cache.get(task.id)
-            if old_task and old_task.status != task.status:
-                old_dir = self.status_dirs[old_task.status]
-                old_file = old_dir / f"{task.id}.md"
-                if old_file.exists():
-                    old_file.unlink()
-            
-            # Generate content
-            content = self._generate_task_file_content(task)
-            
-            # Write file
-            with open(target_file, 'w', encoding='utf-8') as f:
-                f.write(content)
+            self._write_task_file(task, datetime.now())
             
             # Update cache
             self.tasks_cache[task.id] = task
-            self.dependency_graph[task.id] = task.dependencies.copy()
+            self._index_task(task)
+            self.cache_version += 1
             
             logger.info(f"Saved task {task.id} with status {task.status.value}")
             return True
@@ -287,6 +510,99 @@ class TaskManager:
             logger.error(f"Error saving task {task.id}: {e}")
             return False
     
+    def save_tasks(self, tasks: Iterable[Task]) -> int:
+        """Save a batch of tasks: write every file, then update the cache and indexes once"""
+        now = datetime.now()
+        written = []
+        for task in tasks:
+            try:
+                self._write_task_file(task, now)
+            except Exception as e:
+                logger.error(f"Error saving task {task.id}: {e}")
+                continue
+            written.append(task)
+        
+        for task in written:
+            self.tasks_cache[task.id] = task
+            self._index_task(task)
+        if written:
+            self.cache_version += 1
+            logger.info(f"Saved {len(written)} tasks")
+        return len(written)
+    
+    def _write_task_file(self, task: Task, now: datetime) -> None:
+        """Stamp a task and write its file to its status directory, removing any old copy"""
+        if task.created_at is None:
+            task.created_at = now
+        task.updated_at = now
+        task.mark_changed()
+        
+        # Determine target directory
+        target_dir = self.status_dirs[task.status]
+        target_file = target_dir / f"{task.id}.md"
+        
+        # Remove from old location if status changed
+        old_task = self.tasks_cache.get(task.id)
+        if old_task and old_task.status != task.status:
+            old_dir = self.status_dirs[old_task.status]
+            old_file = old_dir / f"{task.id}.md"
+            if old_file.exists():
+                old_file.unlink()
+            self._file_stats.pop(str(old_file), None)
+        
+        # Generate content
+        content = self._generate_task_file_content(task)
+        
+        # Write file
+        with open(target_file, 'w', encoding='utf-8') as f:
+            f.write(content)
+        self._record_file_stat(target_file)
+    
+    def _index_task(self, task: Task) -> None:
+        """Record a task in the dependency graphs and the secondary field indexes"""
+        self._index_dependencies(task)
+        self._unindex_fields(task.id)
+        fields = (task.status, task.agent, task.priority, tuple(task.tags))
+        self._indexed_fields[task.id] = fields
+        self.by_status.setdefault(fields[0], set()).add(task.id)
+        self.by_agent.setdefault(fields[1], set()).add(task.id)
+        self.by_priority.setdefault(fields[2], set()).add(task.id)
+        for tag in fields[3]:
+            self.by_tag.setdefault(tag, set()).add(task.id)
+    
+    def _unindex_fields(self, task_id: str) -> None:
+        """Drop a task from the secondary field indexes"""
+        fields = self._indexed_fields.pop(task_id, None)
+        if fields is None:
+            return
+        status, agent, priority, tags = fields
+        self.by_status[status].discard(task_id)
+        self.by_agent[agent].discard(task_id)
+        self.by_priority[priority].discard(task_id)
+        for tag in tags:
+            self.by_tag[tag].discard(task_id)
+    
+    def _index_dependencies(self, task: Task) -> None:
+        """Record a task's dependencies in the forward and reverse graphs"""
+        for dep_id in self.dependency_graph.get(task.id, []):
+            dependents = self.dependents.get(dep_id)
+            if dependents is not None:
+                dependents.discard(task.id)
+        
+        self.dependency_graph[task.id] = task.dependencies.copy()
+        for dep_id in task.dependencies:
+            self.dependents.setdefault(dep_id, set()).add(task.id)
+    
+    def evict_task(self, task_id: str) -> None:
+        """Remove a task from the in-memory cache and dependency graphs"""
+        for dep_id in self.dependency_graph.pop(task_id, []):
+            dependents = self.dependents.get(dep_id)
+            if dependents is not None:
+                dependents.discard(task_id)
+        self._unindex_fields(task_id)
+        self.tasks_cache.pop(task_id, None)
+        self.cache_version += 1
+    
     def _generate_task_file_content(self, task: Task) -> str:
         """Generate markdown file content for a task"""
         # YAML frontmatter
@@ -318,14 +634,11 @@ class TaskManager:
             
             if self.save_task(task):
                 self.tasks_cache[task.id] = task
-                self.dependency_graph[task.id] = task.dependencies.copy()
+                self._index_task(task)
                 
                 # Log successful creation with emoji
                 duration = time.time() - start_time
-                if hasattr(logger, 'task_created'):
-                    logger.task_created(f"Created task {task.id}: {task.title}")
-                else:
-                    logger.info(f"✨ Created task {task.id}: {task.title}")
+                _log_event('task_created', f"Created task {task.id}: {task.title}")
                 
                 # Audit log
                 if audit_logger:
@@ -389,15 +702,9 @@ class TaskManager:
                 # Log successful status change with emoji
                 duration = time.time() - start_time
                 if new_status == TaskStatus.COMPLETE:
-                    if hasattr(logger, 'task_completed'):
-                        logger.task_completed(f"Task {task_id} completed: {old_status.value} -> {new_status.value}")
-                    else:
-                        logger.info(f"✅ Task {task_id} completed: {old_status.value} -> {new_status.value}")
+                    _log_event('task_completed', f"Task {task_id} completed: {old_status.value} -> {new_status.value}")
                 else:
-                    if hasattr(logger, 'task_updated'):
-                        logger.task_updated(f"Updated task {task_id} status: {old_status.value} -> {new_status.value}")
-                    else:
-                        logger.info(f"🔄 Updated task {task_id} status: {old_status.value} -> {new_status.value}")
+                    _log_event('task_updated', f"Updated task {task_id} status: {old_status.value} -> {new_status.value}")
                 
                 # Audit log
                 if audit_logger:
@@ -440,7 +747,7 @@ class TaskManager:
         start_time = time.time()
         
         try:
-            task = self.tasks_cache.get(task_id)
+            task = self.get_task_lazy(task_id)
             if not task:
                 logger.error(f"Task {task_id} not found")
                 return False
@@ -496,9 +803,9 @@ class TaskManager:
                     if field == 'tags' or field == 'dependencies':
                         setattr(task, field, value)
                     elif field == 'priority':
-                        setattr(task, field, TaskPriority(value))
+                        setattr(task, field, PRIORITY_BY_VALUE.get(value) or TaskPriority(value))
                     elif field == 'due_date':
-                        setattr(task, field, datetime.fromisoformat(value) if value else None)
+                        setattr(task, field, datetime.fromisoformat(value) if isinstance(value, str) else value or None)
                     else:
                         setattr(task, field, value)
 
@@ -564,6 +871,43 @@ class TaskManager:
         """Get a task by ID"""
         return self.tasks_cache.get(task_id)
     
+    def get_task_lazy(self, task_id: str) -> Optional[Task]:
+        """Get a task by ID, loading only its file on a lazy manager's cache miss"""
+        task = self.tasks_cache.get(task_id)
+        if task is not None or not self.lazy:
+            return task
+        
+        # load_all_tasks lets later status directories win, so probe them in reverse
+        for status_dir in reversed(list(self.status_dirs.values())):
+            task_file = status_dir / f"{task_id}.md"
+            if task_file.is_file():
+                task = self.load_task_from_file(task_file)
+                self._record_file_stat(task_file)
+                if task:
+                    self.tasks_cache[task.id] = task
+                    self._index_task(task)
+                    self.cache_version += 1
+                return task
+        return None
+    
+    def ids_where(self, status: Optional[TaskStatus] = None, agent: Optional[str] = None,
+                  priority: Optional[TaskPriority] = None, tag: Optional[str] = None) -> Set[str]:
+        """Get the IDs of tasks matching every given field, from the secondary indexes"""
+        candidates = [
+            index.get(value, set())
+            for index, value in ((self.by_status, status), (self.by_agent, agent),
+                                 (self.by_priority, priority), (self.by_tag, tag))
+            if value is not None
+        ]
+        if not candidates:
+            return set(self.tasks_cache)
+        candidates.sort(key=len)
+        return candidates[0].intersection(*candidates[1:])
+    
+    def get_dependent_ids(self, task_id: str) -> FrozenSet[str]:
+        """Get the IDs of tasks that depend on a task, as a snapshot of the reverse index"""
+        return frozenset(self.dependents.get(task_id, ()))
+    
     def get_tasks_by_status(self, status: TaskStatus) -> List[Task]:
         """Get all tasks with a specific status"""
         return [task for task in self.tasks_cache.values() if task.status == status]
@@ -681,6 +1025,20 @@ class TaskManager:
         
         return transitioned
     
+    def auto_transition_dependents_of(self, task_id: str) -> List[str]:
+        """Auto-transition the BLOCKED tasks depending on a task whose status changed"""
+        transitioned = []
+        
+        # Only a task's dependents can become ready when it changes; sorted() also
+        # copies the set, which status updates re-index while we iterate
+        for dependent_id in sorted(self.dependents.get(task_id, ())):
+            task = self.tasks_cache.get(dependent_id)
+            if task and task.status == TaskStatus.BLOCKED and self._dependencies_satisfied(dependent_id):
+                if self.update_task_status(dependent_id, TaskStatus.PENDING, "Auto-transitioned: dependencies satisfied, moved to PENDING"):
+                    transitioned.append(dependent_id)
+        
+        return transitioned
+    
     def promote_dependency_priority(self) -> List[str]:
         """Automatically promote priority of tasks that are blocking others."""
         promoted_tasks = []
@@ -724,22 +1082,24 @@ class TaskManager:
             'dependency_violations': len(self.validate_dependencies())
         }
         
+        # Count each field column in one C-level pass instead of rescanning per value
+        tasks = self.tasks_cache.values()
+        status_counts = Counter(map(attrgetter('status'), tasks))
+        priority_counts = Counter(map(attrgetter('priority'), tasks))
+        
         # Count by status
         for status in TaskStatus:
-            stats['by_status'][status.value] = len(self.get_tasks_by_status(status))
+            stats['by_status'][status.value] = status_counts[status]
         
         # Count by priority
         for priority in TaskPriority:
-            count = len([t for t in self.tasks_cache.values() if t.priority == priority])
-            stats['by_priority'][priority.value] = count
+            stats['by_priority'][priority.value] = priority_counts[priority]
         
         # Count by agent
-        agents = set(task.agent for task in self.tasks_cache.values())
-        for agent in agents:
-            stats['by_agent'][agent] = len(self.get_tasks_by_agent(agent))
+        stats['by_agent'] = dict(Counter(map(attrgetter('agent'), tasks)))
         
         # Calculate average completion time for completed tasks
-        completed_tasks = self.get_tasks_by_status(TaskStatus.COMPLETE)
+        completed_tasks = [t for t in tasks if t.status == TaskStatus.COMPLETE]
         if completed_tasks:
             completion_times = []
             for task in completed_tasks:
@@ -459,15 +459,13 @@ Update project documentation for {documentation_area}.
     
     def list_templates(self, agent: str = None, tags: List[str] = None) -> List[TaskTemplate]:
         """List available templates, optionally filtered by agent or tags"""
-        templates = list(self.templates.values())
-        
-        if agent:
-            templates = [t for t in templates if t.agent == agent]
-        
-        if tags:
-            templates = [t for t in templates if any(tag in t.tags for tag in tags)]
-        
-        return templates
+        # A template matches on any shared tag; one set check replaces the nested `in` scans
+        tag_set = frozenset(tags) if tags else None
+        return [
+            t for t in self.templates.values()
+            if (not agent or t.agent == agent)
+            and (tag_set is None or not tag_set.isdisjoint(t.tags))
+        ]
     
     def create_task_from_template(self, template_id: str, **kwargs) -> Optional[Task]:
         """Create a new task from a template with custom values"""
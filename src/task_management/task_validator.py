@@ -7,7 +7,8 @@ for the Agent Task management system.
 """
 
 import re
-from typing import List, Dict, Set, Optional, Any, Tuple
+from concurrent.futures import Executor
+from typing import Callable, List, Dict, Set, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from enum import Enum
@@ -15,6 +16,9 @@ from enum import Enum
 from .task_manager import Task, TaskStatus, TaskPriority
 from .config import MAX_TAGS, AGENT_CAPABILITIES, VALID_TAGS
 
+# Below this many tasks, process start-up and pickling cost more than serial validation
+PARALLEL_VALIDATION_THRESHOLD = 100
+
 
 class ValidationSeverity(Enum):
     ERROR = "error"
@@ -391,14 +395,25 @@ class TaskValidator:
         
         return fixes
     
-    def validate_task_system(self, tasks: Dict[str, Task]) -> Tuple[List[ValidationError], List[ValidationError]]:
-        """Validate the entire task system for consistency"""
+    def validate_task_system(self, tasks: Dict[str, Task],
+                             executor_factory: Optional[Callable[[], Executor]] = None
+                             ) -> Tuple[List[ValidationError], List[ValidationError]]:
+        """Validate the entire task system for consistency.
+        
+        Per-task checks are fanned out over an executor from executor_factory when one
+        is given and there are at least PARALLEL_VALIDATION_THRESHOLD tasks; smaller
+        systems never start it. Results keep task order.
+        """
         all_warnings = []
         all_errors = []
         
         # Validate individual tasks first
-        for task in tasks.values():
-            warnings, errors = self.validate_task(task)
+        if executor_factory is not None and len(tasks) >= PARALLEL_VALIDATION_THRESHOLD:
+            with executor_factory() as executor:
+                results = list(executor.map(_validate_task_in_worker, tasks.values(), chunksize=64))
+        else:
+            results = map(self.validate_task, tasks.values())
+        for warnings, errors in results:
             all_warnings.extend(warnings)
             all_errors.extend(errors)
         
@@ -585,3 +600,15 @@ class TaskValidator:
                 report.append(f"  • {issue.field}: {issue.message}{task_info}")
         
         return "\n".join(report)
+
+
+# Per-process validator for parallel validation; per-task checks never touch the task manager
+_worker_validator: Optional[TaskValidator] = None
+
+
+def _validate_task_in_worker(task: Task) -> Tuple[List[ValidationError], List[ValidationError]]:
+    """Validate a single task inside an executor worker"""
+    global _worker_validator
+    if _worker_validator is None:
+        _worker_validator = TaskValidator(task_manager=None)
+    return _worker_validator.validate_task(task)
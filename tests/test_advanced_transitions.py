@@ -0,0 +1,90 @@
+import pytest
+import os
+from collections import Counter, deque
+from datetime import datetime, timedelta
+from src.task_management.task_manager import TaskManager, TaskStatus, TaskPriority
+from src.task_management.advanced_transitions import (
+    AdvancedTransitionEngine, TransitionEvent, TransitionRule, TransitionTrigger
+)
+
+@pytest.fixture
+def engine():
+    if not os.path.exists("temp_tasks"):
+        os.makedirs("temp_tasks")
+    tm = TaskManager(tasks_root="temp_tasks")
+    yield AdvancedTransitionEngine(tm)
+    import shutil
+    if os.path.exists("temp_tasks"):
+        shutil.rmtree("temp_tasks")
+
+def _rule(delay_minutes=0, conditions=None):
+    return TransitionRule(
+        from_status=TaskStatus.TODO,
+        to_status=TaskStatus.IN_PROGRESS,
+        trigger=TransitionTrigger.MANUAL,
+        conditions=conditions or [],
+        delay_minutes=delay_minutes
+    )
+
+def test_pending_queue_ordering_and_dedupe(engine):
+    late, early, same_time = _rule(delay_minutes=30), _rule(delay_minutes=5), _rule(delay_minutes=30)
+    engine._queue_transition("task-a", late)
+    engine._queue_transition("task-a", early)
+    engine._queue_transition("task-a", same_time)
+    # Equal but distinct rule instances are separate entries; the same instance is queued once
+    engine._queue_transition("task-a", late)
+    pending = engine.pending_transitions["task-a"]
+    assert all(rule is expected for (rule, _), expected in zip(pending, [early, late, same_time]))
+    assert len(pending) == len(engine._pending_heap) == 3
+
+def test_pending_entry_popped_when_conditions_lapse(engine):
+    task = engine.task_manager.create_task(id="queued-task", title="Queued", description="", agent="TEST_AGENT",
+                                           priority=TaskPriority.HIGH)
+    rule = _rule(conditions=["high_priority"])
+    engine._queue_transition(task.id, rule)
+    engine.task_manager.update_task_fields(task.id, priority=TaskPriority.LOW)
+    assert engine.process_pending_transitions() == []
+    assert engine.pending_transitions == {}
+    # The popped entry releases its dedupe key, so the pair can be queued again
+    engine._queue_transition(task.id, rule)
+    assert list(engine.pending_transitions) == [task.id]
+
+def test_statistics_match_history_recount(engine):
+    # A small cap so the history starts dropping events
+    engine.transition_history = deque(maxlen=5)
+    triggers = [TransitionTrigger.MANUAL, TransitionTrigger.TIME_BASED, TransitionTrigger.CONDITION_MET]
+    now = datetime.now()
+    for n in range(12):
+        engine._record_event(TransitionEvent(
+            task_id=f"task-{n}",
+            from_status=TaskStatus.TODO,
+            to_status=TaskStatus.IN_PROGRESS,
+            trigger=triggers[n % len(triggers)],
+            timestamp=now - timedelta(hours=29 - n * 2),
+            automated=n % 4 != 0
+        ))
+        history = list(engine.transition_history)
+        automated = sum(event.automated for event in history)
+        stats = engine.get_transition_statistics()
+        assert stats["total_transitions"] == len(history)
+        assert stats["automated_transitions"] == automated
+        assert stats["automation_rate"] == automated / len(history)
+        assert stats["trigger_distribution"] == dict(Counter(event.trigger.value for event in history))
+        assert stats["recent_transitions_24h"] == sum(event.timestamp >= now - timedelta(hours=24) for event in history)
+    assert len(engine.transition_history) == 5
+
+def test_add_remove_rule_round_trip(engine):
+    default_rules = engine.transition_rules
+    first, second = _rule(), _rule()
+    engine.add_custom_rule(first)
+    engine.add_custom_rule(second)
+    assert engine.transition_rules == default_rules + [first, second]
+    # Equal rules are removed by identity, oldest first
+    assert engine.remove_rule(TaskStatus.TODO, TaskStatus.IN_PROGRESS, TransitionTrigger.MANUAL)
+    assert engine.transition_rules[-1] is second and len(engine.transition_rules) == len(default_rules) + 1
+    task = engine.task_manager.create_task(id="rule-task", title="Rule", description="", agent="TEST_AGENT")
+    assert any(rule is second for rule in engine._get_eligible_rules(task))
+    assert not any(rule is first for rule in engine._get_eligible_rules(task))
+    assert engine.remove_rule(TaskStatus.TODO, TaskStatus.IN_PROGRESS, TransitionTrigger.MANUAL)
+    assert not engine.remove_rule(TaskStatus.TODO, TaskStatus.IN_PROGRESS, TransitionTrigger.MANUAL)
+    assert engine.transition_rules == default_rules
@@ -0,0 +1,50 @@
+import pytest
+import os
+from datetime import datetime
+from src.task_management.task_manager import TaskManager, TaskStatus
+from src.task_management.changelog_generator import ChangelogGenerator
+
+@pytest.fixture
+def task_manager():
+    if not os.path.exists("temp_tasks"):
+        os.makedirs("temp_tasks")
+    tm = TaskManager(tasks_root="temp_tasks")
+    yield tm
+    import shutil
+    if os.path.exists("temp_tasks"):
+        shutil.rmtree("temp_tasks")
+
+def _complete(task_manager, task_id, tags, updated_at):
+    task_manager.create_task(id=task_id, title=task_id.title(), description="", agent="TEST_AGENT", tags=tags)
+    task_manager.update_task_status(task_id, TaskStatus.COMPLETE)
+    # Pin the completion day; the changelog reads the in-memory cache
+    task_manager.get_task(task_id).updated_at = updated_at
+
+def test_changelog_categories_and_order(task_manager):
+    _complete(task_manager, "fix-a", ["fixes"], datetime(2024, 1, 2, 9))
+    _complete(task_manager, "other-a", [], datetime(2024, 1, 2, 10))
+    _complete(task_manager, "improve-a", ["improvement"], datetime(2024, 1, 2, 11))
+    # "feature" takes precedence over "bug-fix"
+    _complete(task_manager, "feature-a", ["bug-fix", "feature"], datetime(2024, 1, 2, 12))
+    _complete(task_manager, "fix-b", ["bug-fix"], datetime(2024, 1, 1, 9))
+
+    assert ChangelogGenerator(task_manager).generate_changelog() == (
+        "# Changelog\n\n"
+        "## 2024-01-02\n\n"
+        "### Features\n\n- Feature-A (feature-a)\n\n"
+        "### Improvements\n\n- Improve-A (improve-a)\n\n"
+        "### Bug Fixes\n\n- Fix-A (fix-a)\n\n"
+        "### Uncategorized\n\n- Other-A (other-a)\n\n"
+        "## 2024-01-01\n\n"
+        "### Bug Fixes\n\n- Fix-B (fix-b)\n\n"
+    )
+
+def test_completed_tasks_memoized_on_cache_version(task_manager):
+    generator = ChangelogGenerator(task_manager)
+    _complete(task_manager, "first", [], datetime(2024, 1, 1))
+    completed = generator._get_completed_tasks()
+    assert [task.id for task in completed] == ["first"]
+    assert generator._get_completed_tasks() is completed
+
+    _complete(task_manager, "second", [], datetime(2024, 1, 1))
+    assert sorted(task.id for task in generator._get_completed_tasks()) == ["first", "second"]
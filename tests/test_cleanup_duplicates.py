@@ -0,0 +1,39 @@
+from datetime import datetime, timezone, timedelta
+from cleanup_duplicates import main, parse_task_file, _parse_ts
+
+def test_parse_task_file_reads_frontmatter_only(tmp_path):
+    task_file = tmp_path / "task.md"
+    # The body is not valid YAML; it must never reach the parser
+    task_file.write_text("---\nid: task-1\nstatus: todo\n---\n\nbody: [unclosed\n", encoding="utf-8")
+    assert parse_task_file(task_file) == {"id": "task-1", "status": "todo"}
+
+    no_frontmatter = tmp_path / "plain.md"
+    no_frontmatter.write_text("# Just markdown\n", encoding="utf-8")
+    assert parse_task_file(no_frontmatter) is None
+
+def test_parse_ts_mixed_naive_and_aware():
+    aware = datetime(2024, 1, 1, 12, tzinfo=timezone(timedelta(hours=2)))
+    assert _parse_ts(aware) == datetime(2024, 1, 1, 10)
+    assert _parse_ts("2024-01-01T12:00:00+02:00") == datetime(2024, 1, 1, 10)
+    assert _parse_ts(datetime(2024, 1, 1, 11)) == datetime(2024, 1, 1, 11)
+    assert _parse_ts("not a timestamp") == datetime.min
+    assert _parse_ts(None) == datetime.min
+
+def _write_task(path, status, updated_at):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\nid: dup-task\nstatus: {status}\nupdated_at: '{updated_at}'\n---\n", encoding="utf-8")
+
+def test_main_keeps_newest_copy(tmp_path):
+    older = tmp_path / "📋 todo" / "dup-task.md"
+    newer = tmp_path / "🔄 in-progress" / "dup-task.md"
+    misplaced = tmp_path / "✅ done" / "dup-task.md"
+    # Naive 11:00 is older than aware 12:00+00:00; the misplaced copy is newest but loses
+    _write_task(older, "todo", "2024-01-01T11:00:00")
+    _write_task(newer, "in_progress", "2024-01-01T12:00:00+00:00")
+    _write_task(misplaced, "todo", "2024-01-02T00:00:00")
+
+    main(tmp_path)
+
+    assert newer.exists()
+    assert not older.exists()
+    assert not misplaced.exists()
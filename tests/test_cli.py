@@ -2,7 +2,8 @@ import pytest
 import tempfile
 import shutil
 from click.testing import CliRunner
-from src.task_management.cli import cli, TaskCLI
+from src.task_management.cli import cli, TaskCLI, _get_cli, _shared_cli
+from src.task_management.task_manager import TaskStatus
 
 @pytest.fixture
 def runner():
@@ -51,3 +52,26 @@ def test_update_task_status_cli(runner, temp_tasks_dir):
             print(f"Traceback: {''.join(traceback.format_exception(type(result.exception), result.exception, result.exception.__traceback__))}")
     assert result.exit_code == 0
     assert "Updated task cli-test-task-2 to in_progress" in result.output
+
+def test_get_cli_reuses_instance(temp_tasks_dir):
+    first = _get_cli(temp_tasks_dir)
+    assert _get_cli(temp_tasks_dir, lazy=True) is first
+    _shared_cli.cache_clear()
+    assert _get_cli(temp_tasks_dir) is not first
+
+def test_get_cli_sees_changes_between_lazy_and_full_commands(temp_tasks_dir):
+    lazy_cli = _get_cli(temp_tasks_dir, lazy=True)
+    lazy_cli.task_manager.create_task(id='shared-task', title='Shared', description='', agent='TESTER')
+    assert lazy_cli.task_manager.get_task_lazy('shared-task').status == TaskStatus.TODO
+    
+    # A full command reuses the same store and must see every task
+    full_cli = _get_cli(temp_tasks_dir)
+    assert full_cli.task_manager is lazy_cli.task_manager and not full_cli.task_manager.lazy
+    full_cli.task_manager.update_task_status('shared-task', TaskStatus.IN_PROGRESS)
+    assert _get_cli(temp_tasks_dir, lazy=True).task_manager.get_task_lazy('shared-task').status == TaskStatus.IN_PROGRESS
+    
+    # Edits made behind the CLI's back are picked up on the next reuse
+    other = TaskCLI(temp_tasks_dir).task_manager
+    other.update_task_status('shared-task', TaskStatus.COMPLETE)
+    assert _get_cli(temp_tasks_dir).task_manager.get_task('shared-task').status == TaskStatus.COMPLETE
+    _shared_cli.cache_clear()
@@ -55,3 +55,108 @@ def test_add_note_to_task(task_manager):
     assert success
     updated_task = task_manager.get_task("test-task-3")
     assert "This is a test note." in updated_task.notes
+
+def test_dependents_index(task_manager):
+    task_manager.create_task(id="dep-base", title="Base", description="", agent="TEST_AGENT")
+    task_manager.create_task(id="dep-child", title="Child", description="", agent="TEST_AGENT",
+                             dependencies=["dep-base"])
+    dependent_ids = task_manager.get_dependent_ids("dep-base")
+    assert dependent_ids == {"dep-child"} and isinstance(dependent_ids, frozenset)
+
+    task_manager.update_task_fields("dep-child", dependencies=[])
+    assert task_manager.get_dependent_ids("dep-base") == set()
+
+def test_auto_transition_dependents_of(task_manager):
+    task_manager.create_task(id="at-base", title="Base", description="", agent="TEST_AGENT",
+                             status=TaskStatus.COMPLETE)
+    task_manager.create_task(id="at-child", title="Child", description="", agent="TEST_AGENT",
+                             status=TaskStatus.BLOCKED, dependencies=["at-base"])
+    task_manager.create_task(id="at-other", title="Other", description="", agent="TEST_AGENT",
+                             status=TaskStatus.BLOCKED, dependencies=["missing"])
+    assert task_manager.auto_transition_dependents_of("at-base") == ["at-child"]
+    assert task_manager.get_task("at-child").status == TaskStatus.PENDING
+    assert task_manager.get_task("at-other").status == TaskStatus.BLOCKED
+
+def test_field_indexes(task_manager):
+    task_manager.create_task(id="idx-a", title="A", description="", agent="AGENT_A",
+                             priority=TaskPriority.HIGH, tags=["cli"])
+    task_manager.create_task(id="idx-b", title="B", description="", agent="AGENT_B",
+                             priority=TaskPriority.HIGH)
+    assert task_manager.ids_where(priority=TaskPriority.HIGH) == {"idx-a", "idx-b"}
+    assert task_manager.ids_where(priority=TaskPriority.HIGH, tag="cli") == {"idx-a"}
+    task_manager.update_task_status("idx-a", TaskStatus.IN_PROGRESS)
+    assert task_manager.ids_where(status=TaskStatus.TODO) == {"idx-b"}
+    assert task_manager.ids_where(status=TaskStatus.IN_PROGRESS, agent="AGENT_A") == {"idx-a"}
+    task_manager.evict_task("idx-a")
+    assert task_manager.ids_where(tag="cli") == set()
+
+def test_save_tasks_batch(task_manager):
+    tasks = [task_manager.create_task(id=f"batch-{n}", title=f"Batch {n}", description="", agent="TEST_AGENT")
+             for n in range(3)]
+    for task in tasks:
+        task.agent = "OTHER_AGENT"
+    version = task_manager.cache_version
+    assert task_manager.save_tasks(tasks) == 3
+    assert task_manager.cache_version == version + 1
+    assert task_manager.ids_where(agent="OTHER_AGENT") == {"batch-0", "batch-1", "batch-2"}
+    reloaded = TaskManager(tasks_root="temp_tasks")
+    assert reloaded.get_task("batch-1").agent == "OTHER_AGENT"
+
+def test_to_dict_memo(task_manager):
+    task = task_manager.create_task(id="memo-task", title="Memo", description="", agent="TEST_AGENT", tags=["a"])
+    first = task.to_dict()
+    first["tags"].append("corrupted")
+    first["title"] = "Corrupted"
+    assert task.to_dict()["tags"] == ["a"]
+    assert task.to_dict()["title"] == "Memo"
+    task_manager.update_task_fields("memo-task", title="Renamed")
+    assert task.to_dict()["title"] == "Renamed"
+    task.tags.append("b")
+    task.mark_changed()
+    assert task.to_dict()["tags"] == ["a", "b"]
+
+def test_get_task_lazy(task_manager):
+    task_manager.create_task(
+        id="test-task-lazy",
+        title="Lazy Task",
+        description="Loaded on demand.",
+        agent="TEST_AGENT",
+        priority=TaskPriority.LOW
+    )
+    lazy_manager = TaskManager(tasks_root="temp_tasks", lazy=True)
+    assert lazy_manager.tasks_cache == {}
+    task = lazy_manager.get_task_lazy("test-task-lazy")
+    assert task is not None
+    assert task.title == "Lazy Task"
+    assert lazy_manager.get_task("test-task-lazy") is task
+    assert lazy_manager.get_task_lazy("missing-task") is None
+
+def test_task_cache_opt_in(task_manager, tmp_path, monkeypatch):
+    task_manager.create_task(
+        id="test-task-cached",
+        title="Cached Task",
+        description="Parsed once.",
+        agent="TEST_AGENT",
+        priority=TaskPriority.MEDIUM
+    )
+    cached_manager = TaskManager(tasks_root="temp_tasks", cache_dir=str(tmp_path))
+    assert cached_manager.cache_file.parent == tmp_path and cached_manager.cache_file.exists()
+    assert not any(name.startswith('.') for name in os.listdir("temp_tasks"))
+
+    # Tasks served from the cache match a fresh parse
+    from_cache = TaskManager(tasks_root="temp_tasks", cache_dir=str(tmp_path))
+    fresh = TaskManager(tasks_root="temp_tasks")
+    assert from_cache.get_task("test-task-cached") == fresh.get_task("test-task-cached")
+
+    # Files whose stat is unchanged are not even hashed
+    import src.task_management.task_manager as task_manager_module
+    def no_hash(*args, **kwargs):
+        raise AssertionError("unchanged file was hashed")
+    monkeypatch.setattr(task_manager_module.hashlib, "blake2b", no_hash)
+    assert TaskManager(tasks_root="temp_tasks", cache_dir=str(tmp_path)).get_task("test-task-cached")
+    monkeypatch.undo()
+
+    # An edited file is re-parsed rather than served from the cache
+    task_manager.update_task_fields("test-task-cached", title="Edited Task")
+    reloaded = TaskManager(tasks_root="temp_tasks", cache_dir=str(tmp_path))
+    assert reloaded.get_task("test-task-cached").title == "Edited Task"
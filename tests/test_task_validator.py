@@ -132,3 +132,43 @@ def test_validate_task_agent_assignment(validator):
     warnings, errors = validator.validate_task(task)
     assert any("Unknown agent 'DOCUMENTER'. Suggested migration: 'DEVELOPER' (auto-fixable)" in warning.message for warning in warnings)
     assert not errors
+
+def _parallel_validation_tasks():
+    from src.task_management.task_validator import PARALLEL_VALIDATION_THRESHOLD
+
+    tasks = {}
+    for i in range(PARALLEL_VALIDATION_THRESHOLD + 20):
+        task = Task(
+            id=f"task-{i}",
+            title=f"Task {i}",
+            description="Parallel validation task.",
+            agent="CODEFORGE" if i % 2 else "UNKNOWN_AGENT",
+            status=TaskStatus.TODO,
+            priority=TaskPriority.CRITICAL if i % 3 == 0 else TaskPriority.LOW,
+            dependencies=[f"task-{i}"] if i % 5 == 0 else []
+        )
+        tasks[task.id] = task
+    return tasks
+
+def test_validate_task_system_with_executor(validator):
+    from concurrent.futures import ThreadPoolExecutor
+
+    tasks = _parallel_validation_tasks()
+    validator.task_manager.tasks_cache = tasks
+
+    serial = validator.validate_task_system(tasks)
+    parallel = validator.validate_task_system(tasks, executor_factory=lambda: ThreadPoolExecutor(max_workers=4))
+    assert parallel == serial
+    assert serial[1]
+
+def test_validate_task_system_with_process_pool(validator):
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Tasks and the worker function must pickle across real processes
+    tasks = _parallel_validation_tasks()
+    validator.task_manager.tasks_cache = tasks
+
+    serial = validator.validate_task_system(tasks)
+    parallel = validator.validate_task_system(tasks, executor_factory=lambda: ProcessPoolExecutor(max_workers=2))
+    assert parallel == serial
+    assert serial[0] and serial[1]
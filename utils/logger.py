@@ -19,7 +19,7 @@ import sys
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List, Tuple
 from contextlib import contextmanager
 
 try:
@@ -466,9 +466,28 @@ def critical(message: str, *args, **kwargs):
     logger.critical(message, *args, **kwargs)
 
 
+def build_event_loggers(events: Dict[str, Tuple[str, str]]) -> Dict[str, Tuple[Callable[..., None], str]]:
+    """
+    Resolve log events to (log function, message prefix) once, up front
+    
+    Args:
+        events: Event name -> (fallback emoji, fallback level method name)
+    
+    Returns:
+        Event name -> (logger's semantic method and no prefix, or the level
+        method and the emoji prefix when the logger has no such method)
+    """
+    return {
+        event: ((semantic, '') if (semantic := getattr(logger, event, None)) is not None
+                else (getattr(logger, level), f"{emoji} "))
+        for event, (emoji, level) in events.items()
+    }
+
+
 # Export commonly used items
 __all__ = [
     'logger',
+    'build_event_loggers',
     'audit_logger', 
     'performance_logger',
     'setup_logging',